@@ -5,14 +5,19 @@ A Streamlit dashboard for analyzing SalesCloser.ai lead performance
 from Pipedrive CSV exports.
 """
 
+import io
+
 import streamlit as st
 import pandas as pd
 
 from data_processing import (
     load_and_clean_csv,
-    enrich_dataframe,
-    calculate_metrics,
-    calculate_summary_metrics,
+    enrich_dataframe_parallel,
+    calculate_grouping_sets,
+    aggregate_measures,
+    build_cube,
+    stream_cube,
+    FilterIndex,
 )
 from visualizations import (
     create_country_map,
@@ -23,10 +28,145 @@ from visualizations import (
     create_ae_sc_heatmap,
     create_country_sc_bar,
     display_kpi_row,
+    figure_cache_stats,
     format_metrics_table,
     get_column_config,
 )
-from config import DEFAULT_SC_INCLUDE, AES
+from config import (
+    DEFAULT_SC_INCLUDE,
+    AES,
+    CSV_ENGINE,
+    CUBE_MODE,
+    ANALYTICS_BACKEND,
+    DASHBOARD_GROUPINGS,
+    STREAMING_MIN_BYTES,
+    PRECOMPUTE_VIEWS,
+)
+from dataset_cache import dataset_key, read_cached, write_cached
+from duckdb_backend import DuckDBBackend, HAS_DUCKDB
+from session_cache import MemoCache, filter_state
+from precompute import Precomputer
+from dataset_store import store as dataset_store
+from exports import EXPORT_FORMATS, export_formats, export_payload
+
+
+def load_dataset(uploaded_file, key: str, streaming: bool) -> pd.DataFrame:
+    """Enriched deals (or the streamed cube) for an upload, via the Parquet cache."""
+    df = read_cached(key)
+    if df is None:
+        if streaming:
+            # Too large to hold as deals: fold chunks straight into the cube
+            uploaded_file.seek(0)
+            df = stream_cube(uploaded_file)
+        else:
+            data = io.BytesIO(uploaded_file.getvalue())
+            df_raw = load_and_clean_csv(data, fast=True, engine=CSV_ENGINE)
+            df = enrich_dataframe_parallel(df_raw, categorical=True, drop_raw=True)
+        write_cached(key, df)
+    return df
+
+
+def load_index(uploaded_file, key: str, streaming: bool):
+    """Filter index (or DuckDB database) over the dataset the dashboard queries."""
+    df = load_dataset(uploaded_file, key, streaming)
+    if CUBE_MODE and not streaming:
+        df = build_cube(df)
+    if ANALYTICS_BACKEND == "duckdb" and HAS_DUCKDB:
+        return DuckDBBackend.from_frame(df)
+    return FilterIndex(df)
+
+
+def won_pct_pivot(metrics: pd.DataFrame, columns: str, order: list = None) -> pd.DataFrame:
+    """AE x columns Won % matrix for the heatmaps, optionally in column order."""
+    pivot = metrics.pivot(index="ae_name", columns=columns, values="Won_Pct").fillna(0)
+    if order:
+        pivot = pivot[[c for c in order if c in pivot.columns]]
+    return pivot
+
+
+def download_table(table_df: pd.DataFrame, name: str):
+    """Export format picker and download button; the file is built on click."""
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox(
+            "Export format",
+            export_formats(),
+            key=f"{name}_export_format",
+            label_visibility="collapsed"
+        )
+    extension, mime = EXPORT_FORMATS[fmt]
+    with col2:
+        st.download_button(
+            label=f"📥 Download {fmt}",
+            data=export_payload(table_df, fmt),
+            file_name=f"{name}.{extension}",
+            mime=mime,
+            key=f"{name}_download",
+            on_click="ignore"
+        )
+
+
+def held_only(table_df: pd.DataFrame) -> pd.DataFrame:
+    """Drop table columns not meaningful for AE views (all deals are held)."""
+    return table_df.drop(columns=[c for c in ["No-Show %", "Booked"] if c in table_df.columns])
+
+
+def view_artifacts(breakdowns: dict) -> dict:
+    """
+    {name: compute} for every view's figures and tables.
+
+    Shared by the render path and background precompute, so both store the
+    same values under the same memo keys. Views with nothing to show are
+    left out, as they are when rendering.
+    """
+    artifacts = {}
+
+    country_metrics = breakdowns[("country", "segment")]
+    if len(country_metrics) > 0:
+        artifacts["country_map"] = lambda: create_country_map(country_metrics)
+        artifacts["country_table"] = lambda: format_metrics_table(
+            country_metrics, ["country", "segment"]
+        )
+
+    # AE breakdowns only cover AE-owned (demo held) deals
+    if breakdowns[()]["demos_held"] > 0:
+        ae_metrics = breakdowns[("ae_name",)]
+        artifacts["ae_bar"] = lambda: create_ae_bar_chart(ae_metrics)
+        artifacts["ae_scatter"] = lambda: create_ae_scatter(ae_metrics)
+        artifacts["ae_table"] = lambda: held_only(format_metrics_table(ae_metrics, ["ae_name"]))
+
+        ae_seg_metrics = breakdowns[("ae_name", "segment")]
+        if len(ae_seg_metrics) > 0:
+            artifacts["ae_segment_heatmap"] = lambda: create_ae_segment_heatmap(
+                won_pct_pivot(ae_seg_metrics, "segment", ["AAA", "B-Tier", "Non-Demo"])
+            )
+            artifacts["ae_segment_table"] = lambda: held_only(
+                format_metrics_table(ae_seg_metrics, ["ae_name", "segment"])
+            )
+
+        ae_sc_metrics = breakdowns[("ae_name", "sc_type")]
+        if len(ae_sc_metrics) > 0:
+            artifacts["ae_sc_heatmap"] = lambda: create_ae_sc_heatmap(
+                won_pct_pivot(ae_sc_metrics, "sc_type")
+            )
+            artifacts["ae_sc_table"] = lambda: held_only(
+                format_metrics_table(ae_sc_metrics, ["ae_name", "sc_type"])
+            )
+
+    sc_metrics = breakdowns[("sc_type",)]
+    if len(sc_metrics) > 0:
+        artifacts["sc_funnel"] = lambda: create_sc_funnel(sc_metrics)
+        artifacts["sc_type_table"] = lambda: format_metrics_table(sc_metrics, ["sc_type"])
+
+    country_sc_metrics = breakdowns[("country", "sc_type")]
+    if len(country_sc_metrics) > 0:
+        artifacts["country_sc_bar"] = lambda: create_country_sc_bar(country_sc_metrics)
+        artifacts["country_sc_table"] = lambda: format_metrics_table(
+            country_sc_metrics, ["country", "sc_type"]
+        )
+
+    return artifacts
+
 
 # Page config
 st.set_page_config(
@@ -41,80 +181,144 @@ st.caption("SalesCloser.ai Lead Performance Analysis")
 # File upload
 uploaded_file = st.file_uploader("Upload Pipedrive CSV Export", type="csv")
 
+# Filtered frames, metrics and figures memoized for this browser session,
+# filled in the background for the default filters
+memo = st.session_state.setdefault("memo", MemoCache())
+precompute = st.session_state.setdefault("precompute", Precomputer(memo))
+
 if uploaded_file is not None:
-    # Load and process data
-    with st.spinner("Processing data..."):
-        df_raw = load_and_clean_csv(uploaded_file)
-        df = enrich_dataframe(df_raw)
+    # Load and process data once per upload; reruns reuse the filter index
+    # (or the DuckDB database holding the dataset). Sessions uploading the
+    # same export share one index from the process-wide store.
+    if st.session_state.get("upload_id") != uploaded_file.file_id:
+        with st.spinner("Processing data..."):
+            streaming = uploaded_file.size >= STREAMING_MIN_BYTES
+            key = dataset_key(uploaded_file.getbuffer()) + ("-stream" if streaming else "")
+            index, lease = dataset_store.acquire(
+                key, lambda: load_index(uploaded_file, key, streaming)
+            )
+            st.session_state["filter_index"] = index
+            # Replacing (or dropping with the session) the lease releases the
+            # previous dataset
+            st.session_state["dataset_lease"] = lease
+            st.session_state["dataset_key"] = key
+            st.session_state["streaming"] = streaming
+            st.session_state["upload_id"] = uploaded_file.file_id
+
+    index = st.session_state["filter_index"]
+
+    if st.session_state["streaming"]:
+        st.info(
+            "Large export: streamed into daily aggregates. All metrics and charts "
+            "are computed from the aggregates; deal-level data is not kept in memory."
+        )
 
     # Sidebar filters
     st.sidebar.header("Filters")
 
+    # Initial widget values, i.e. what background precompute targets
+    default_filters = dict(date_range=None, sc_types=[], pipelines=None, segments=[], aes=None)
+
     # Date range filter
-    if "created_date" in df.columns and df["created_date"].notna().any():
-        min_date = df["created_date"].min().date()
-        max_date = df["created_date"].max().date()
+    date_range = None
+    date_bounds = index.date_bounds()
+    if date_bounds:
+        min_date, max_date = date_bounds
+        default_filters["date_range"] = (min_date, max_date)
         date_range = st.sidebar.date_input(
             "Date Range",
             value=(min_date, max_date),
             min_value=min_date,
             max_value=max_date
         )
-        if len(date_range) == 2:
-            df = df[
-                (df["created_date"].dt.date >= date_range[0]) &
-                (df["created_date"].dt.date <= date_range[1])
-            ]
 
     # SC Type filter (SC5, SC6 unchecked by default)
-    sc_types = sorted(df["sc_type"].unique().tolist())
+    sc_types = index.options("sc_type")
+    default_filters["sc_types"] = [sc for sc in sc_types if sc in DEFAULT_SC_INCLUDE]
     selected_sc = st.sidebar.multiselect(
         "SC Type",
         options=sc_types,
-        default=[sc for sc in sc_types if sc in DEFAULT_SC_INCLUDE]
+        default=default_filters["sc_types"]
     )
-    if selected_sc:
-        df = df[df["sc_type"].isin(selected_sc)]
 
     # Pipeline filter
-    if "pipeline" in df.columns:
-        pipelines = sorted(df["pipeline"].dropna().unique().tolist())
-        if pipelines:
-            selected_pipelines = st.sidebar.multiselect(
-                "Pipeline",
-                options=pipelines,
-                default=pipelines
-            )
-            if selected_pipelines:
-                df = df[df["pipeline"].isin(selected_pipelines)]
+    selected_pipelines = None
+    pipelines = index.options("pipeline")
+    if pipelines:
+        default_filters["pipelines"] = pipelines
+        selected_pipelines = st.sidebar.multiselect(
+            "Pipeline",
+            options=pipelines,
+            default=pipelines
+        )
 
     # Segment filter
     segments = ["AAA", "B-Tier", "Non-Demo"]
-    available_segments = [s for s in segments if s in df["segment"].values]
+    available_segments = [s for s in segments if s in index.options("segment")]
+    default_filters["segments"] = available_segments
     selected_segments = st.sidebar.multiselect(
         "Segment",
         options=available_segments,
         default=available_segments
     )
-    if selected_segments:
-        df = df[df["segment"].isin(selected_segments)]
 
     # AE filter
-    ae_names = sorted([ae for ae in df["ae_name"].dropna().unique().tolist()])
+    selected_aes = None
+    ae_names = index.options("ae_name")
     if ae_names:
+        default_filters["aes"] = ae_names
         selected_aes = st.sidebar.multiselect(
             "Account Executive",
             options=ae_names,
             default=ae_names
         )
 
+    filters = dict(
+        date_range=date_range,
+        sc_types=selected_sc,
+        pipelines=selected_pipelines,
+        segments=selected_segments,
+        aes=selected_aes,
+    )
+
+    state_key = (st.session_state["dataset_key"], filter_state(filters))
+
+    def memoized(name: str, compute):
+        """Memoize compute() for the current dataset and filter state."""
+        return precompute.get_or_compute(state_key + (name,), compute)
+
+    # Every breakdown (and the KPI summary) from one scan of the filtered rows
+    if isinstance(index, DuckDBBackend):
+        breakdowns = memoized(
+            "breakdowns", lambda: index.calculate_grouping_sets(DASHBOARD_GROUPINGS, **filters)
+        )
+        segment_totals = memoized(
+            "segment_totals", lambda: index.aggregate_measures(["segment"], **filters)
+        )
+    else:
+        df = memoized("filtered", lambda: index.filter(**filters))
+        breakdowns = memoized(
+            "breakdowns", lambda: calculate_grouping_sets(df, DASHBOARD_GROUPINGS)
+        )
+        segment_totals = memoized(
+            "segment_totals", lambda: aggregate_measures(df, ["segment"])
+        )
+
+    # Build every view in the background while the KPI row is read; work for
+    # the defaults is cancelled once the filters move away from them
+    artifacts = view_artifacts(breakdowns)
+    if PRECOMPUTE_VIEWS and filter_state(filters) == filter_state(default_filters):
+        precompute.submit(state_key, artifacts)
+    else:
+        precompute.cancel()
+
+    # KPI Summary
+    summary = breakdowns[()]
+
     # Check if we have data after filtering
-    if len(df) == 0:
+    if summary["demos_booked"] == 0:
         st.warning("No data matches the selected filters. Please adjust your filter criteria.")
     else:
-        # KPI Summary
-        summary = calculate_summary_metrics(df)
-        segment_counts = df["segment"].value_counts()
 
         # Performance metrics
         st.subheader("Performance")
@@ -140,12 +344,9 @@ if uploaded_file is not None:
         st.subheader("By Segment")
 
         # Calculate segment stats
-        total_leads = len(df)
-        df_held = df[df["is_demo_held"]]
-        total_held = len(df_held)
-
-        segment_leads = df["segment"].value_counts()
-        segment_demos = df_held["segment"].value_counts()
+        segment_totals = segment_totals.set_index("segment")
+        segment_leads = segment_totals["Deals"]
+        segment_demos = segment_totals["Demos_Held"]
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -159,29 +360,36 @@ if uploaded_file is not None:
 
         st.divider()
 
-        # Tabs
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-            "🌍 By Country",
-            "👤 By AE",
-            "📢 By SC Type",
-            "👤×🎯 AE × Segment",
-            "👤×📢 AE × SC Type",
-            "🌍×📢 Country × SC Type"
-        ])
+        # View selector: unlike st.tabs, only the selected view is computed
+        # (and memoized), and the choice survives reruns in session state
+        active_tab = st.radio(
+            "View",
+            [
+                "🌍 By Country",
+                "👤 By AE",
+                "📢 By SC Type",
+                "👤×🎯 AE × Segment",
+                "👤×📢 AE × SC Type",
+                "🌍×📢 Country × SC Type"
+            ],
+            horizontal=True,
+            key="active_tab",
+            label_visibility="collapsed"
+        )
 
         # Tab 1: By Country
-        with tab1:
+        if active_tab == "🌍 By Country":
             st.subheader("Performance by Country")
-            country_metrics = calculate_metrics(df, ["country", "segment"])
+            country_metrics = breakdowns[("country", "segment")]
 
             if len(country_metrics) > 0:
                 # Map
-                fig_map = create_country_map(country_metrics)
+                fig_map = memoized("country_map", artifacts["country_map"])
                 st.plotly_chart(fig_map, use_container_width=True)
 
                 # Table
                 with st.expander("📊 View Data Table", expanded=True):
-                    table_df = format_metrics_table(country_metrics, ["country", "segment"])
+                    table_df = memoized("country_table", artifacts["country_table"])
                     st.dataframe(
                         table_df,
                         column_config=get_column_config(),
@@ -191,38 +399,26 @@ if uploaded_file is not None:
                     )
 
                     # Download button
-                    csv = table_df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv,
-                        file_name="country_metrics.csv",
-                        mime="text/csv"
-                    )
+                    download_table(table_df, "country_metrics")
 
         # Tab 2: By AE
-        with tab2:
+        if active_tab == "👤 By AE":
             st.subheader("Performance by Account Executive")
 
-            # Filter to AE-owned deals only
-            df_ae = df[df["is_demo_held"]]
-
-            if len(df_ae) > 0:
-                ae_metrics = calculate_metrics(df_ae, ["ae_name"])
+            # AE breakdowns only cover AE-owned (demo held) deals
+            if summary["demos_held"] > 0:
+                ae_metrics = breakdowns[("ae_name",)]
 
                 col1, col2 = st.columns(2)
                 with col1:
-                    fig_bar = create_ae_bar_chart(ae_metrics)
+                    fig_bar = memoized("ae_bar", artifacts["ae_bar"])
                     st.plotly_chart(fig_bar, use_container_width=True)
                 with col2:
-                    fig_scatter = create_ae_scatter(ae_metrics)
+                    fig_scatter = memoized("ae_scatter", artifacts["ae_scatter"])
                     st.plotly_chart(fig_scatter, use_container_width=True)
 
                 with st.expander("📊 View Data Table", expanded=True):
-                    table_df = format_metrics_table(ae_metrics, ["ae_name"])
-                    # Remove columns not meaningful for AE view (all deals are held)
-                    cols_to_drop = [c for c in ["No-Show %", "Booked"] if c in table_df.columns]
-                    if cols_to_drop:
-                        table_df = table_df.drop(columns=cols_to_drop)
+                    table_df = memoized("ae_table", artifacts["ae_table"])
                     st.dataframe(
                         table_df,
                         column_config=get_column_config(),
@@ -231,27 +427,21 @@ if uploaded_file is not None:
                         height=400
                     )
 
-                    csv = table_df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv,
-                        file_name="ae_metrics.csv",
-                        mime="text/csv"
-                    )
+                    download_table(table_df, "ae_metrics")
             else:
                 st.info("No demo-held deals in the selected data.")
 
         # Tab 3: By SC Type
-        with tab3:
+        if active_tab == "📢 By SC Type":
             st.subheader("Performance by Lead Source (SC Type)")
-            sc_metrics = calculate_metrics(df, ["sc_type"])
+            sc_metrics = breakdowns[("sc_type",)]
 
             if len(sc_metrics) > 0:
-                fig_funnel = create_sc_funnel(sc_metrics)
+                fig_funnel = memoized("sc_funnel", artifacts["sc_funnel"])
                 st.plotly_chart(fig_funnel, use_container_width=True)
 
                 with st.expander("📊 View Data Table", expanded=True):
-                    table_df = format_metrics_table(sc_metrics, ["sc_type"])
+                    table_df = memoized("sc_type_table", artifacts["sc_type_table"])
                     st.dataframe(
                         table_df,
                         column_config=get_column_config(),
@@ -260,43 +450,21 @@ if uploaded_file is not None:
                         height=400
                     )
 
-                    csv = table_df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv,
-                        file_name="sc_type_metrics.csv",
-                        mime="text/csv"
-                    )
+                    download_table(table_df, "sc_type_metrics")
 
         # Tab 4: AE × Segment
-        with tab4:
+        if active_tab == "👤×🎯 AE × Segment":
             st.subheader("AE × Segment Matrix")
 
-            df_ae = df[df["is_demo_held"]]
-
-            if len(df_ae) > 0:
-                ae_seg_metrics = calculate_metrics(df_ae, ["ae_name", "segment"])
+            if summary["demos_held"] > 0:
+                ae_seg_metrics = breakdowns[("ae_name", "segment")]
 
                 if len(ae_seg_metrics) > 0:
-                    # Pivot for heatmap
-                    pivot = ae_seg_metrics.pivot(
-                        index="ae_name",
-                        columns="segment",
-                        values="Won_Pct"
-                    ).fillna(0)
-
-                    # Reorder columns
-                    segment_order = ["AAA", "B-Tier", "Non-Demo"]
-                    pivot = pivot[[c for c in segment_order if c in pivot.columns]]
-
-                    fig_heatmap = create_ae_segment_heatmap(pivot)
+                    fig_heatmap = memoized("ae_segment_heatmap", artifacts["ae_segment_heatmap"])
                     st.plotly_chart(fig_heatmap, use_container_width=True)
 
                     with st.expander("📊 View Data Table"):
-                        table_df = format_metrics_table(ae_seg_metrics, ["ae_name", "segment"])
-                        cols_to_drop = [c for c in ["No-Show %", "Booked"] if c in table_df.columns]
-                        if cols_to_drop:
-                            table_df = table_df.drop(columns=cols_to_drop)
+                        table_df = memoized("ae_segment_table", artifacts["ae_segment_table"])
                         st.dataframe(
                             table_df,
                             column_config=get_column_config(),
@@ -308,29 +476,18 @@ if uploaded_file is not None:
                 st.info("No demo-held deals in the selected data.")
 
         # Tab 5: AE × SC Type
-        with tab5:
+        if active_tab == "👤×📢 AE × SC Type":
             st.subheader("AE × SC Type Matrix")
 
-            df_ae = df[df["is_demo_held"]]
-
-            if len(df_ae) > 0:
-                ae_sc_metrics = calculate_metrics(df_ae, ["ae_name", "sc_type"])
+            if summary["demos_held"] > 0:
+                ae_sc_metrics = breakdowns[("ae_name", "sc_type")]
 
                 if len(ae_sc_metrics) > 0:
-                    pivot = ae_sc_metrics.pivot(
-                        index="ae_name",
-                        columns="sc_type",
-                        values="Won_Pct"
-                    ).fillna(0)
-
-                    fig_heatmap = create_ae_sc_heatmap(pivot)
+                    fig_heatmap = memoized("ae_sc_heatmap", artifacts["ae_sc_heatmap"])
                     st.plotly_chart(fig_heatmap, use_container_width=True)
 
                     with st.expander("📊 View Data Table"):
-                        table_df = format_metrics_table(ae_sc_metrics, ["ae_name", "sc_type"])
-                        cols_to_drop = [c for c in ["No-Show %", "Booked"] if c in table_df.columns]
-                        if cols_to_drop:
-                            table_df = table_df.drop(columns=cols_to_drop)
+                        table_df = memoized("ae_sc_table", artifacts["ae_sc_table"])
                         st.dataframe(
                             table_df,
                             column_config=get_column_config(),
@@ -342,17 +499,17 @@ if uploaded_file is not None:
                 st.info("No demo-held deals in the selected data.")
 
         # Tab 6: Country × SC Type
-        with tab6:
+        if active_tab == "🌍×📢 Country × SC Type":
             st.subheader("Country × SC Type Comparison")
 
-            country_sc_metrics = calculate_metrics(df, ["country", "sc_type"])
+            country_sc_metrics = breakdowns[("country", "sc_type")]
 
             if len(country_sc_metrics) > 0:
-                fig_bar = create_country_sc_bar(country_sc_metrics)
+                fig_bar = memoized("country_sc_bar", artifacts["country_sc_bar"])
                 st.plotly_chart(fig_bar, use_container_width=True)
 
                 with st.expander("📊 View Data Table"):
-                    table_df = format_metrics_table(country_sc_metrics, ["country", "sc_type"])
+                    table_df = memoized("country_sc_table", artifacts["country_sc_table"])
                     st.dataframe(
                         table_df,
                         column_config=get_column_config(),
@@ -361,13 +518,23 @@ if uploaded_file is not None:
                         height=400
                     )
 
-                    csv = table_df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv,
-                        file_name="country_sc_metrics.csv",
-                        mime="text/csv"
-                    )
+                    download_table(table_df, "country_sc_metrics")
+
+    # Debug panel: memo cache effectiveness for this session
+    with st.sidebar.expander("🛠 Cache Stats"):
+        stats = memo.stats()
+        st.caption(f"Hits: {stats['hits']:,} · Misses: {stats['misses']:,} "
+                   f"({stats['hit_rate']:.0%} hit rate)")
+        st.caption(f"Entries: {stats['entries']:,} · Evictions: {stats['evictions']:,}")
+        st.caption(f"Memory: {stats['bytes'] / 1024 ** 2:,.1f} / "
+                   f"{stats['max_bytes'] / 1024 ** 2:,.0f} MB")
+        fig_stats = figure_cache_stats()
+        st.caption(f"Figures: {fig_stats['entries']:,} / {fig_stats['max_entries']:,} cached · "
+                   f"{fig_stats['hits']:,} hits · {fig_stats['misses']:,} misses")
+        store_stats = dataset_store.stats()
+        st.caption(f"Shared datasets: {store_stats['datasets']:,} "
+                   f"({store_stats['referenced']:,} in use, "
+                   f"{store_stats['bytes'] / 1024 ** 2:,.1f} MB)")
 
 else:
     st.info("👆 Upload a Pipedrive CSV export to get started.")
@@ -41,6 +41,123 @@ COLUMN_MAPPINGS = {
     "Person - Timezone": "timezone",
 }
 
+# Dtypes pinned for the mapped columns when loading with fast=True
+COLUMN_DTYPES = {
+    "Deal - Title": "str",
+    "Deal - Deal value": "float64",
+    "Deal - Pipeline": "str",
+    "Deal - Status": "str",
+    "Deal - Owner": "str",
+    "Person - Phone": "str",
+    "Deal - Deal created on": "str",
+    "Person - Timezone": "str",
+}
+
+# Format of "Deal - Deal created on" in Pipedrive exports
+CREATED_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# CSV parser for the fast loader ("pyarrow" falls back to "c" if not installed)
+CSV_ENGINE = "pyarrow"
+
+# Bump whenever enrich_dataframe output changes so cached datasets are rebuilt
+ENRICH_VERSION = 4
+
+# Parallel enrichment: rows per chunk and worker processes (None = CPU count).
+# Exports smaller than PARALLEL_MIN_ROWS are enriched inline.
+ENRICH_CHUNK_SIZE = 250_000
+ENRICH_WORKERS = None
+PARALLEL_MIN_ROWS = 500_000
+
+# Uploads larger than this are streamed in STREAM_CHUNK_SIZE-row chunks straight
+# into the cube (see CUBE_MODE) instead of being loaded as one dataframe.
+# Keep below Streamlit's server.maxUploadSize (200 MB by default).
+STREAMING_MIN_BYTES = 150 * 1024 ** 2
+STREAM_CHUNK_SIZE = 200_000
+
+# Memory budget for datasets shared across sessions (dataset_store); datasets no
+# session is using are evicted least recently used first beyond it
+DATASET_STORE_MAX_BYTES = 2 * 1024 ** 3
+
+# Memory budget for the per-session memo of filtered frames, metrics and figures
+# (session_cache.MemoCache); least recently used entries are evicted beyond it
+MEMO_MAX_BYTES = 256 * 1024 ** 2
+
+# Table downloads (exports.py): payloads are built on click and cached
+# up to EXPORT_CACHE_MAX_BYTES
+EXPORT_CACHE_MAX_BYTES = 128 * 1024 ** 2
+
+# Large-cardinality charts: the AE scatter renders with WebGL ("auto") above
+# WEBGL_MIN_POINTS points, and groups beyond CHART_MAX_GROUPS bars (or
+# SCATTER_MAX_POINTS points), ranked by Demos Held, are merged into "Other"
+CHART_RENDER_MODE = "auto"
+WEBGL_MIN_POINTS = 200
+CHART_MAX_GROUPS = 50
+SCATTER_MAX_POINTS = 1000
+
+# Figures kept by visualizations.figure_cache (least recently used evicted first)
+FIGURE_CACHE_MAX_ENTRIES = 128
+
+# Build every view's figures and tables on a background thread pool after an
+# upload (for the default filters), so opening a view doesn't stall
+PRECOMPUTE_VIEWS = True
+PRECOMPUTE_WORKERS = 2
+
+# Columns the dashboard reads after enrichment (drop_raw=True drops the rest)
+DASHBOARD_COLUMNS = [
+    "title",
+    "deal_value",
+    "pipeline",
+    "status",
+    "owner",
+    "created_date",
+    "sc_type",
+    "is_demo_held",
+    "ae_name",
+    "country",
+    "segment",
+    "is_won",
+    "won_value",
+]
+
+# Columns stored as pandas categoricals with categorical=True
+CATEGORICAL_COLUMNS = ["owner", "pipeline", "status", "sc_type", "ae_name", "country", "segment"]
+
+# Leading category order per column; values not listed follow in sorted order
+CATEGORY_ORDERS = {
+    "segment": ["AAA", "B-Tier", "Non-Demo"],
+    "sc_type": list(SC_CODES),
+    "status": ["Open", "Won", "Lost"],
+}
+
+# On-disk cache of enriched datasets (Parquet, LRU-evicted above the size cap)
+CACHE_DIR = ".cache/datasets"
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# Collapse deals into a day-level cube after enrichment; filters, tabs and KPIs
+# then read the cube instead of the per-deal frame
+CUBE_MODE = True
+
+# Backend for calculate_metrics, aggregate_measures and calculate_grouping_sets:
+# "numpy" (bincount kernel) or "pandas" (groupby).
+# numpy falls back to pandas when the group key space exceeds BINCOUNT_MAX_GROUPS.
+METRICS_BACKEND = "numpy"
+BINCOUNT_MAX_GROUPS = 1_000_000
+
+# Where filters and metrics run: "pandas" or "duckdb" (in-process DuckDB,
+# needs the optional duckdb package; falls back to pandas without it)
+ANALYTICS_BACKEND = "pandas"
+
+# Breakdowns computed for the dashboard tabs; () is the KPI summary
+DASHBOARD_GROUPINGS = [
+    ("country", "segment"),
+    ("ae_name",),
+    ("sc_type",),
+    ("ae_name", "segment"),
+    ("ae_name", "sc_type"),
+    ("country", "sc_type"),
+    (),
+]
+
 # Color palette
 COLORS = {
     # Segment colors
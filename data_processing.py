@@ -2,23 +2,127 @@
 Core data processing functions for the Lead Dashboard.
 """
 
-import pandas as pd
+import multiprocessing
+import os
 import re
-from config import AES, COLUMN_MAPPINGS
-from mappings import TIMEZONE_TO_COUNTRY, parse_country_from_phone, get_segment
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from config import (
+    AES,
+    COLUMN_MAPPINGS,
+    COLUMN_DTYPES,
+    CREATED_DATE_FORMAT,
+    DASHBOARD_COLUMNS,
+    CATEGORICAL_COLUMNS,
+    CATEGORY_ORDERS,
+    ENRICH_CHUNK_SIZE,
+    ENRICH_WORKERS,
+    PARALLEL_MIN_ROWS,
+    STREAM_CHUNK_SIZE,
+    METRICS_BACKEND,
+    BINCOUNT_MAX_GROUPS,
+)
+from mappings import (
+    TIMEZONE_TO_COUNTRY,
+    parse_country_from_phone,
+    parse_countries_from_phones,
+    get_segment,
+)
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+def _rewind(source):
+    """Seek a file-like source back to the start so it can be read again."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def _read_mapped_columns(source, engine: str = None) -> pd.DataFrame:
+    """Read only the columns in COLUMN_MAPPINGS, with pinned dtypes."""
+    # Read the header first: the pyarrow engine doesn't accept callable usecols
+    header = pd.read_csv(source, nrows=0).columns
+    _rewind(source)
+    usecols = [c for c in COLUMN_MAPPINGS if c in header]
+    dtype = {c: COLUMN_DTYPES[c] for c in usecols if c in COLUMN_DTYPES}
+
+    try:
+        return pd.read_csv(source, usecols=usecols, dtype=dtype, engine=engine)
+    except ValueError:
+        # Non-numeric deal value - read it as text and let pd.to_numeric coerce it
+        _rewind(source)
+        dtype["Deal - Deal value"] = "str"
+        return pd.read_csv(source, usecols=usecols, dtype=dtype, engine=engine)
+
+
+def _parse_created_date(values: pd.Series) -> pd.Series:
+    """Parse created dates with the known export format, inferring only for misses."""
+    parsed = pd.to_datetime(values, format=CREATED_DATE_FORMAT, errors="coerce")
+    missed = parsed.isna() & values.notna()
+    if missed.any():
+        parsed[missed] = pd.to_datetime(values[missed], errors="coerce")
+    return parsed
+
+
+def load_and_clean_csv(uploaded_file, fast: bool = False, engine: str = None):
+    """
+    Load CSV and standardize column names.
+
+    With fast=True only the mapped columns are parsed, using the dtypes in
+    COLUMN_DTYPES and CREATED_DATE_FORMAT for the created date. engine is
+    passed to pd.read_csv ("pyarrow" falls back to the default parser when
+    pyarrow isn't installed).
+    """
+    if engine == "pyarrow" and not HAS_PYARROW:
+        engine = None
+
+    if fast:
+        df = _read_mapped_columns(uploaded_file, engine)
+    else:
+        df = pd.read_csv(uploaded_file, engine=engine)
 
+    return _clean_columns(df, fast)
 
-def load_and_clean_csv(uploaded_file):
-    """Load CSV and standardize column names."""
-    df = pd.read_csv(uploaded_file)
 
+def iter_csv_chunks(source, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Yield cleaned chunks of the mapped columns, chunk_size rows at a time.
+
+    Same output as load_and_clean_csv(fast=True), without ever holding the
+    whole file as a dataframe.
+    """
+    header = pd.read_csv(source, nrows=0).columns
+    _rewind(source)
+    usecols = [c for c in COLUMN_MAPPINGS if c in header]
+    dtype = {c: COLUMN_DTYPES[c] for c in usecols if c in COLUMN_DTYPES}
+
+    # A bad value can't be retried mid-stream, so let pd.to_numeric coerce it
+    if "Deal - Deal value" in dtype:
+        dtype["Deal - Deal value"] = "str"
+
+    for chunk in pd.read_csv(source, usecols=usecols, dtype=dtype, chunksize=chunk_size):
+        yield _clean_columns(chunk, fast=True)
+
+
+def _clean_columns(df: pd.DataFrame, fast: bool) -> pd.DataFrame:
+    """Rename mapped columns and parse dates and deal values."""
     # Rename columns using mapping
     rename_dict = {k: v for k, v in COLUMN_MAPPINGS.items() if k in df.columns}
     df = df.rename(columns=rename_dict)
 
     # Parse dates
     if "created_date" in df.columns:
-        df["created_date"] = pd.to_datetime(df["created_date"], errors="coerce")
+        if fast:
+            df["created_date"] = _parse_created_date(df["created_date"])
+        else:
+            df["created_date"] = pd.to_datetime(df["created_date"], errors="coerce")
 
     # Clean deal value
     if "deal_value" in df.columns:
@@ -27,23 +131,30 @@ def load_and_clean_csv(uploaded_file):
     return df
 
 
+SC_CODE_PATTERN = re.compile(r"SC(\d+)", re.IGNORECASE)
+
+
 def extract_sc_code(title: str) -> str:
     """Extract SC code from deal title."""
     if not title or pd.isna(title):
         return "No SC"
-    match = re.search(r"SC(\d+)", str(title), re.IGNORECASE)
+    match = SC_CODE_PATTERN.search(str(title))
     return f"SC{match.group(1)}" if match else "No SC"
 
 
+def extract_sc_codes(titles: pd.Series) -> pd.Series:
+    """Vectorized extract_sc_code over a column of deal titles."""
+    digits = titles.astype("string").str.extract(SC_CODE_PATTERN, expand=False)
+    return ("SC" + digits).fillna("No SC").astype(str)
+
+
+# AES lowercased once, in match order
+_AE_PATTERNS = tuple((ae.lower(), ae) for ae in AES)
+
+
 def is_ae(owner: str) -> bool:
     """Check if deal owner is an Account Executive."""
-    if not owner or pd.isna(owner):
-        return False
-    owner_lower = str(owner).lower().strip()
-    for ae in AES:
-        if ae.lower() in owner_lower:
-            return True
-    return False
+    return get_ae_name(owner) is not None
 
 
 def get_ae_name(owner: str) -> str:
@@ -51,12 +162,32 @@ def get_ae_name(owner: str) -> str:
     if not owner or pd.isna(owner):
         return None
     owner_lower = str(owner).lower().strip()
-    for ae in AES:
-        if ae.lower() in owner_lower:
+    for ae_lower, ae in _AE_PATTERNS:
+        if ae_lower in owner_lower:
             return ae
     return None
 
 
+def match_aes(owners: pd.Series) -> tuple:
+    """
+    Resolve is_demo_held and ae_name for a column of deal owners.
+
+    Each distinct owner is matched once against AES (same first-match-wins
+    order as is_ae/get_ae_name) and the results are broadcast to every row.
+    Returns (is_demo_held, ae_name) Series aligned with owners.
+    """
+    codes, uniques = pd.factorize(owners)
+
+    # Trailing slot catches code -1 (null owner)
+    names = [get_ae_name(owner) for owner in uniques] + [None]
+    name_lookup = np.array(names, dtype=object)
+    held_lookup = np.array([name is not None for name in names], dtype=bool)
+
+    is_demo_held = pd.Series(held_lookup[codes], index=owners.index)
+    ae_name = pd.Series(name_lookup[codes], index=owners.index)
+    return is_demo_held, ae_name
+
+
 def get_country(timezone: str, phone: str) -> str:
     """Derive country from timezone, falling back to phone prefix."""
     # Try timezone first
@@ -73,23 +204,80 @@ def get_country(timezone: str, phone: str) -> str:
     return "Unknown"
 
 
-def enrich_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Add derived columns to dataframe."""
+def normalize_phones(phones: pd.Series) -> pd.Series:
+    """Vectorized version of the cleanup parse_country_from_phone applies."""
+    return (
+        phones.astype(str)
+        .str.strip()
+        .str.replace("'", "", regex=False)
+        .str.replace(" ", "", regex=False)
+        .str.replace("-", "", regex=False)
+    )
+
+
+def resolve_countries(timezones: pd.Series, phones: pd.Series) -> pd.Series:
+    """
+    Vectorized get_country over timezone and phone columns.
+
+    Timezones are mapped in one lookup; only rows that miss have their
+    phone normalized and resolved in one batched prefix lookup over the
+    distinct normalized phones.
+    """
+    countries = timezones.astype(str).str.strip().map(TIMEZONE_TO_COUNTRY)
+    countries = countries.to_numpy(dtype=object, copy=True)
+
+    missed = pd.isna(countries)
+    if missed.any():
+        codes, uniques = pd.factorize(normalize_phones(phones[missed]))
+        # Trailing slot catches code -1 (null phone)
+        lookup = np.append(parse_countries_from_phones(uniques), None)
+        lookup[pd.isna(lookup)] = "Unknown"
+        countries[missed] = lookup[codes]
+
+    return pd.Series(countries, index=timezones.index)
+
+
+def to_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert CATEGORICAL_COLUMNS to pandas categoricals.
+
+    Categories start with the config order from CATEGORY_ORDERS, followed by
+    any other values present in sorted order.
+    """
     df = df.copy()
+    for col in CATEGORICAL_COLUMNS:
+        if col not in df.columns:
+            continue
+        order = CATEGORY_ORDERS.get(col, [])
+        extras = set(df[col].dropna().unique()) - set(order)
+        categories = list(order) + sorted(extras, key=str)
+        df[col] = pd.Categorical(df[col], categories=categories)
+    return df
 
-    # Extract SC code
-    df["sc_type"] = df["title"].apply(extract_sc_code)
 
-    # Determine if demo was held (owner is AE)
-    df["is_demo_held"] = df["owner"].apply(is_ae)
+def enrich_dataframe(
+    df: pd.DataFrame,
+    categorical: bool = False,
+    drop_raw: bool = False,
+) -> pd.DataFrame:
+    """
+    Add derived columns to dataframe.
 
-    # Get standardized AE name
-    df["ae_name"] = df["owner"].apply(get_ae_name)
+    categorical=True stores the string columns as categoricals (see
+    to_categorical); drop_raw=True keeps only DASHBOARD_COLUMNS.
+    """
+    df = df.copy()
+
+    # Extract SC code
+    df["sc_type"] = extract_sc_codes(df["title"])
+
+    # Determine if demo was held (owner is AE) and get standardized AE name
+    df["is_demo_held"], df["ae_name"] = match_aes(df["owner"])
 
     # Derive country
-    df["country"] = df.apply(
-        lambda row: get_country(row.get("timezone"), row.get("phone")),
-        axis=1
+    df["country"] = resolve_countries(
+        df.get("timezone", pd.Series(None, index=df.index, dtype=object)),
+        df.get("phone", pd.Series(None, index=df.index, dtype=object)),
     )
 
     # Derive segment
@@ -98,52 +286,189 @@ def enrich_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     # Is won
     df["is_won"] = df["status"].str.lower() == "won"
 
+    # Won value (deal value of won deals, 0 otherwise)
+    if "deal_value" in df.columns:
+        df["won_value"] = df["deal_value"].where(df["is_won"], 0)
+
+    if drop_raw:
+        df = df[[c for c in DASHBOARD_COLUMNS if c in df.columns]]
+
+    if categorical:
+        df = to_categorical(df)
+
+    return df
+
+
+def _concat_chunks(parts: list) -> pd.DataFrame:
+    """Concatenate enriched chunks with the dtypes a single pass would infer."""
+    df = pd.concat(parts)
+    for col in df.columns:
+        if len({str(part[col].dtype) for part in parts}) > 1:
+            # e.g. a chunk with no AE owners infers ae_name as object, not str
+            df[col] = pd.Series(df[col].to_numpy(dtype=object), index=df.index)
     return df
 
 
-def calculate_metrics(df: pd.DataFrame, group_cols: list) -> pd.DataFrame:
+def enrich_dataframe_parallel(
+    df: pd.DataFrame,
+    categorical: bool = False,
+    drop_raw: bool = False,
+    workers: int = ENRICH_WORKERS,
+    chunk_size: int = ENRICH_CHUNK_SIZE,
+    min_rows: int = PARALLEL_MIN_ROWS,
+) -> pd.DataFrame:
     """
-    Calculate standard metrics grouped by specified columns.
+    enrich_dataframe over fixed-size row chunks in a process pool.
 
-    Returns dataframe with: Demos_Booked, No_Shows, NoShow_Pct,
-    Demos_Held, Won, Won_Pct, Won_Value, Value_Per_Held
+    Chunks are concatenated in order, so the output matches enrich_dataframe.
+    Runs inline when df has fewer than min_rows rows or fits in one chunk.
     """
-    # Aggregate base metrics
-    agg = df.groupby(group_cols, as_index=False).agg(
-        Demos_Booked=("title", "count"),
-        Demos_Held=("is_demo_held", "sum"),
-        Won=("is_won", "sum"),
-    )
+    workers = workers or os.cpu_count() or 1
+    if len(df) < min_rows or len(df) <= chunk_size or workers < 2:
+        return enrich_dataframe(df, categorical=categorical, drop_raw=drop_raw)
 
-    # Calculate Won_Value separately (sum of deal_value where is_won is True)
-    won_value = df[df["is_won"]].groupby(group_cols, as_index=False).agg(
-        Won_Value=("deal_value", "sum")
-    )
+    chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
 
-    # Merge won value
-    agg = agg.merge(won_value, on=group_cols, how="left")
-    agg["Won_Value"] = agg["Won_Value"].fillna(0)
+    # spawn rather than fork: the Streamlit server process is multi-threaded
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as pool:
+        parts = list(pool.map(partial(enrich_dataframe, drop_raw=drop_raw), chunks))
 
-    # Calculate derived metrics
-    agg["No_Shows"] = agg["Demos_Booked"] - agg["Demos_Held"]
-    agg["NoShow_Pct"] = agg["No_Shows"] / agg["Demos_Booked"].replace(0, pd.NA)
-    agg["Won_Pct"] = agg["Won"] / agg["Demos_Held"].replace(0, pd.NA)
-    agg["Value_Per_Held"] = agg["Won_Value"] / agg["Demos_Held"].replace(0, pd.NA)
+    df = _concat_chunks(parts)
+
+    # Categories depend on the whole column, so encode after concatenating
+    if categorical:
+        df = to_categorical(df)
+
+    return df
+
+
+# Base measures that roll up to coarser groupings by summing
+BASE_MEASURES = ["Deals", "Demos_Booked", "Demos_Held", "Won", "Won_Value"]
+
+# Grain of the pre-aggregated cube (created_date truncated to the day)
+CUBE_DIMENSIONS = [
+    "created_date",
+    "sc_type",
+    "pipeline",
+    "segment",
+    "country",
+    "ae_name",
+    "is_demo_held",
+    "is_won",
+]
 
-    # Fill NaN with 0
-    agg = agg.fillna(0)
 
+def is_cube(df: pd.DataFrame) -> bool:
+    """True if df is a pre-aggregated cube (see build_cube) rather than deals."""
+    return "Deals" in df.columns
+
+
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """numerator / denominator, with 0 wherever the denominator is 0."""
+    return (numerator / denominator.where(denominator != 0)).fillna(0)
+
+
+def _add_derived_metrics(agg: pd.DataFrame) -> pd.DataFrame:
+    """Add No_Shows and the ratio metrics to aggregated base measures."""
+    agg["No_Shows"] = agg["Demos_Booked"] - agg["Demos_Held"]
+    agg["NoShow_Pct"] = _safe_ratio(agg["No_Shows"], agg["Demos_Booked"])
+    agg["Won_Pct"] = _safe_ratio(agg["Won"], agg["Demos_Held"])
+    agg["Value_Per_Held"] = _safe_ratio(agg["Won_Value"], agg["Demos_Held"])
     return agg
 
 
-def calculate_summary_metrics(df: pd.DataFrame) -> dict:
-    """Calculate overall summary metrics."""
-    demos_booked = len(df)
-    demos_held = int(df["is_demo_held"].sum())
-    no_shows = demos_booked - demos_held
-    won = int(df["is_won"].sum())
-    won_value = df.loc[df["is_won"], "deal_value"].sum() if "deal_value" in df.columns else 0
+def _bincount_measures(df: pd.DataFrame, group_cols: list, dropna: bool = True) -> pd.DataFrame:
+    """
+    aggregate_measures via integer group codes and np.bincount.
+
+    Each group column is factorized (sorted, so output order matches
+    groupby), the codes are combined into one key per row and every
+    measure is a (weighted) bincount over that key. Null keys are dropped,
+    or with dropna=False form their own group, sorted last as in groupby.
+    Returns None when the key space is larger than BINCOUNT_MAX_GROUPS.
+    """
+    codes, uniques = [], []
+    for col in group_cols:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Category codes are already sorted integer keys
+            col_codes = values.cat.codes.to_numpy()
+            col_uniques = pd.CategoricalIndex(values.cat.categories, dtype=values.dtype)
+        else:
+            col_codes, col_uniques = pd.factorize(values, sort=True)
+        if len(col_uniques) == 0:
+            # All-null key column: leave the edge case to groupby
+            return None
+        codes.append(col_codes)
+        uniques.append(col_uniques)
+
+    # With dropna=False a null key gets the code after the last value
+    shape = tuple(max(len(u) + (not dropna), 1) for u in uniques)
+    size = int(np.prod(shape, dtype=np.int64))
+    if size > BINCOUNT_MAX_GROUPS:
+        return None
+
+    if dropna:
+        valid = np.logical_and.reduce([c >= 0 for c in codes])
+        key = np.ravel_multi_index([c[valid] for c in codes], shape)
+    else:
+        valid = slice(None)
+        key = np.ravel_multi_index(
+            [np.where(c >= 0, c, len(u)) for c, u in zip(codes, uniques)], shape
+        )
+
+    if is_cube(df):
+        weights = {m: df[m].to_numpy()[valid] for m in BASE_MEASURES}
+    else:
+        won_value = df["won_value"] if "won_value" in df.columns else (
+            df["deal_value"].where(df["is_won"], 0)
+        )
+        weights = {
+            "Deals": None,
+            "Demos_Booked": df["title"].notna().to_numpy()[valid],
+            "Demos_Held": df["is_demo_held"].to_numpy()[valid],
+            "Won": df["is_won"].to_numpy()[valid],
+            "Won_Value": won_value.to_numpy()[valid],
+        }
+
+    counts = np.bincount(key, minlength=size)
+    present = np.flatnonzero(counts)
+    group_codes = np.unravel_index(present, shape)
+
+    columns = {}
+    for col, col_uniques, col_codes in zip(group_cols, uniques, group_codes):
+        null = col_codes == len(col_uniques)
+        keys = pd.Series(col_uniques.take(np.where(null, 0, col_codes)))
+        columns[col] = keys.where(~null) if null.any() else keys
+    for measure, w in weights.items():
+        if w is None:
+            columns[measure] = counts[present]
+            continue
+        sums = np.bincount(key, weights=w, minlength=size)[present]
+        columns[measure] = sums if measure == "Won_Value" else sums.round().astype(np.int64)
+
+    return pd.DataFrame(columns)
+
+
+def calculate_metrics(
+    df: pd.DataFrame,
+    group_cols: list,
+    backend: str = METRICS_BACKEND,
+) -> pd.DataFrame:
+    """
+    Calculate standard metrics grouped by specified columns.
+
+    Returns dataframe with: Demos_Booked, No_Shows, NoShow_Pct,
+    Demos_Held, Won, Won_Pct, Won_Value, Value_Per_Held
+    """
+    agg = aggregate_measures(df, group_cols, backend=backend, dropna=True)
+    return _add_derived_metrics(agg.drop(columns="Deals"))
+
 
+def _summary_metrics(demos_booked: int, demos_held: int, won: int, won_value: float) -> dict:
+    """Summary KPI dict from overall totals."""
+    no_shows = demos_booked - demos_held
     return {
         "demos_booked": demos_booked,
         "demos_held": demos_held,
@@ -154,6 +479,232 @@ def calculate_summary_metrics(df: pd.DataFrame) -> dict:
     }
 
 
+def calculate_summary_metrics(df: pd.DataFrame) -> dict:
+    """Calculate overall summary metrics."""
+    if is_cube(df):
+        return _summary_metrics(
+            demos_booked=int(df["Deals"].sum()),
+            demos_held=int(df["Demos_Held"].sum()),
+            won=int(df["Won"].sum()),
+            won_value=df["Won_Value"].sum(),
+        )
+
+    return _summary_metrics(
+        demos_booked=len(df),
+        demos_held=int(df["is_demo_held"].sum()),
+        won=int(df["is_won"].sum()),
+        won_value=df.loc[df["is_won"], "deal_value"].sum() if "deal_value" in df.columns else 0,
+    )
+
+
+def aggregate_measures(
+    df: pd.DataFrame,
+    group_cols: list,
+    backend: str = METRICS_BACKEND,
+    dropna: bool = False,
+) -> pd.DataFrame:
+    """
+    Sum BASE_MEASURES per group of deals or cube cells, keeping null keys
+    unless dropna.
+
+    backend="numpy" uses the bincount kernel, falling back to the pandas
+    groupby when it can't handle the input.
+    """
+    if backend == "numpy" and len(df) > 0:
+        try:
+            agg = _bincount_measures(df, group_cols, dropna)
+        except (TypeError, ValueError):
+            # e.g. unorderable mixed-type keys in factorize(sort=True)
+            agg = None
+        if agg is not None:
+            return agg
+
+    if is_cube(df):
+        return df.groupby(group_cols, as_index=False, observed=True, dropna=dropna)[
+            BASE_MEASURES
+        ].sum()
+
+    # Won value per row (deal_value where is_won), precomputed by enrich_dataframe
+    if "won_value" not in df.columns:
+        df = df.assign(won_value=df["deal_value"].where(df["is_won"], 0))
+
+    return df.groupby(group_cols, as_index=False, observed=True, dropna=dropna).agg(
+        Deals=("is_won", "size"),
+        Demos_Booked=("title", "count"),
+        Demos_Held=("is_demo_held", "sum"),
+        Won=("is_won", "sum"),
+        Won_Value=("won_value", "sum"),
+    )
+
+
+def calculate_grouping_sets(
+    df: pd.DataFrame,
+    grouping_sets: list,
+    backend: str = METRICS_BACKEND,
+) -> dict:
+    """
+    Calculate metrics for several groupings from a single scan of df.
+
+    df is aggregated once at the finest grain covering every grouping set,
+    then rolled up to each set. Returns {tuple(group_cols): metrics} with
+    the same frames calculate_metrics would return; an empty grouping set
+    () maps to the calculate_summary_metrics dict.
+    """
+    grain = list(dict.fromkeys(col for cols in grouping_sets for col in cols))
+    if not grain:
+        return {(): calculate_summary_metrics(df)}
+
+    base = aggregate_measures(df, grain, backend=backend)
+
+    results = {}
+    for cols in grouping_sets:
+        cols = tuple(cols)
+        if cols:
+            results[cols] = calculate_metrics(base, list(cols), backend=backend)
+        else:
+            results[cols] = calculate_summary_metrics(base)
+    return results
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapse enriched deals into a cube of BASE_MEASURES per CUBE_DIMENSIONS cell.
+
+    created_date is truncated to the day. The cube has the same dimension
+    columns as the deals, so FilterIndex, calculate_metrics,
+    calculate_summary_metrics and calculate_grouping_sets accept it in
+    place of the per-deal frame.
+    """
+    if "created_date" in df.columns:
+        df = df.assign(created_date=df["created_date"].dt.normalize())
+    dims = [col for col in CUBE_DIMENSIONS if col in df.columns]
+    return aggregate_measures(df, dims)
+
+
+def stream_cube(source, chunk_size: int = STREAM_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Build the build_cube output for a CSV export in one streaming pass.
+
+    Each chunk is loaded, enriched and collapsed into a cube, then folded
+    into the running cube, so peak memory is bounded by chunk_size plus
+    the cube itself. The per-deal frame is never materialized.
+    """
+    cube = None
+    for chunk in iter_csv_chunks(source, chunk_size):
+        part = build_cube(enrich_dataframe(chunk, drop_raw=True))
+        if cube is None:
+            cube = part
+        else:
+            dims = [col for col in part.columns if col not in BASE_MEASURES]
+            cube = aggregate_measures(pd.concat([cube, part], ignore_index=True), dims)
+
+    return to_categorical(cube)
+
+
+def _date_bounds(date_range: tuple, tz=None) -> tuple:
+    """Half-open [start, end) timestamps covering the days in date_range."""
+    start = pd.Timestamp(date_range[0])
+    end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+    if tz is not None:
+        start = start.tz_localize(tz)
+        end = end.tz_localize(tz)
+    return start, end
+
+
+# Columns with a precomputed mask per distinct value in FilterIndex
+FILTER_COLUMNS = ["sc_type", "pipeline", "segment", "ae_name"]
+
+
+class FilterIndex:
+    """
+    Precomputed boolean masks for filtering one enriched dataset.
+
+    The dataset is kept sorted by created_date (undated rows last), so a
+    date range is two searchsorted calls and a contiguous slice. Within
+    that slice, every distinct value of FILTER_COLUMNS has a precomputed
+    mask, so the remaining filters are a few vectorized OR/AND operations
+    and a single take. Filtered rows come back in created_date order.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if "created_date" in df.columns:
+            df = df.sort_values("created_date", kind="stable", na_position="last")
+            dated = df["created_date"].notna().sum()
+            self.dates = pd.DatetimeIndex(df["created_date"].iloc[:dated])
+        else:
+            self.dates = pd.DatetimeIndex([])
+        self.df = df
+
+        self.masks = {}
+        for col in FILTER_COLUMNS:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col])
+            self.masks[col] = {value: codes == i for i, value in enumerate(uniques)}
+
+        if "is_demo_held" in df.columns:
+            self.is_demo_held = df["is_demo_held"].to_numpy(dtype=bool)
+        else:
+            self.is_demo_held = np.zeros(len(df), dtype=bool)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the dataset and its masks."""
+        masks = sum(mask.nbytes for values in self.masks.values() for mask in values.values())
+        return int(self.df.memory_usage(deep=True).sum()) + masks + self.is_demo_held.nbytes
+
+    def options(self, col: str) -> list:
+        """Sorted distinct non-null values of a filter column."""
+        return sorted(self.masks.get(col, {}))
+
+    def date_bounds(self) -> tuple:
+        """(min, max) created date, or None if no row has one."""
+        if len(self.dates) == 0:
+            return None
+        return self.dates[0].date(), self.dates[-1].date()
+
+    def date_slice(self, date_range: tuple) -> slice:
+        """Positions of rows created within date_range (inclusive)."""
+        start, end = _date_bounds(date_range, self.dates.tz)
+        return slice(
+            self.dates.searchsorted(start, side="left"),
+            self.dates.searchsorted(end, side="left"),
+        )
+
+    def value_mask(self, col: str, values: list, rows: slice = slice(None)) -> np.ndarray:
+        """Rows (within the rows slice) where col is any of values."""
+        mask = np.zeros_like(self.is_demo_held[rows])
+        for value in values:
+            if value in self.masks[col]:
+                mask |= self.masks[col][value][rows]
+        return mask
+
+    def filter(
+        self,
+        date_range: tuple = None,
+        sc_types: list = None,
+        pipelines: list = None,
+        segments: list = None,
+        aes: list = None,
+    ) -> pd.DataFrame:
+        """Rows matching every given filter; empty or None filters are skipped."""
+        rows = slice(0, len(self.df))
+        if date_range and len(date_range) == 2 and "created_date" in self.df.columns:
+            rows = self.date_slice(date_range)
+
+        mask = np.ones(rows.stop - rows.start, dtype=bool)
+
+        for col, values in (("sc_type", sc_types), ("pipeline", pipelines), ("segment", segments)):
+            if values and col in self.masks:
+                mask &= self.value_mask(col, values, rows)
+
+        # AE filter only applies to demo-held deals
+        if aes and "ae_name" in self.masks:
+            mask &= self.value_mask("ae_name", aes, rows) | ~self.is_demo_held[rows]
+
+        return self.df.iloc[rows.start + np.flatnonzero(mask)]
+
+
 def filter_dataframe(
     df: pd.DataFrame,
     date_range: tuple = None,
@@ -162,25 +713,29 @@ def filter_dataframe(
     segments: list = None,
     aes: list = None,
 ) -> pd.DataFrame:
-    """Apply filters to dataframe."""
-    filtered = df.copy()
-
-    if date_range and len(date_range) == 2 and "created_date" in filtered.columns:
-        filtered = filtered[
-            (filtered["created_date"].dt.date >= date_range[0]) &
-            (filtered["created_date"].dt.date <= date_range[1])
-        ]
-
-    if sc_types:
-        filtered = filtered[filtered["sc_type"].isin(sc_types)]
-
-    if pipelines:
-        filtered = filtered[filtered["pipeline"].isin(pipelines)]
-
-    if segments:
-        filtered = filtered[filtered["segment"].isin(segments)]
-
-    if aes:
-        filtered = filtered[filtered["ae_name"].isin(aes) | ~filtered["is_demo_held"]]
+    """
+    Apply filters to dataframe, keeping its row order.
 
-    return filtered
+    One combined mask and a single take; for filtering the same dataset
+    repeatedly, build a FilterIndex instead.
+    """
+    mask = np.ones(len(df), dtype=bool)
+
+    if date_range and len(date_range) == 2 and "created_date" in df.columns:
+        dates = df["created_date"]
+        start, end = _date_bounds(date_range, dates.dt.tz)
+        mask &= ((dates >= start) & (dates < end)).to_numpy()
+
+    for col, values in (("sc_type", sc_types), ("pipeline", pipelines), ("segment", segments)):
+        if values and col in df.columns:
+            mask &= df[col].isin(values).to_numpy()
+
+    # AE filter only applies to demo-held deals
+    if aes and "ae_name" in df.columns:
+        if "is_demo_held" in df.columns:
+            held = df["is_demo_held"].to_numpy(dtype=bool)
+        else:
+            held = np.zeros(len(df), dtype=bool)
+        mask &= df["ae_name"].isin(aes).to_numpy() | ~held
+
+    return df[mask]
@@ -0,0 +1,136 @@
+"""
+Content-addressed on-disk cache of enriched datasets.
+
+Entries are Parquet files named after a hash of the uploaded bytes plus a
+version of every config and mapping table that affects enrichment, so a
+change to AES, COUNTRY_TO_SEGMENT, TIMEZONE_TO_COUNTRY etc. invalidates them.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from config import (
+    AES,
+    CATEGORICAL_COLUMNS,
+    CATEGORY_ORDERS,
+    COLUMN_MAPPINGS,
+    COLUMN_DTYPES,
+    CREATED_DATE_FORMAT,
+    DASHBOARD_COLUMNS,
+    ENRICH_VERSION,
+    CACHE_DIR,
+    CACHE_MAX_BYTES,
+)
+from data_processing import HAS_PYARROW
+from mappings import (
+    TIMEZONE_TO_COUNTRY,
+    PHONE_PREFIX_TO_COUNTRY,
+    CANADIAN_AREA_CODES,
+    COUNTRY_TO_SEGMENT,
+)
+
+
+def tables_version() -> str:
+    """Hash of the config and mapping tables that enrichment depends on."""
+    h = hashlib.blake2b(digest_size=8)
+    for table in (
+        ENRICH_VERSION,
+        AES,
+        COLUMN_MAPPINGS,
+        COLUMN_DTYPES,
+        CREATED_DATE_FORMAT,
+        CATEGORICAL_COLUMNS,
+        CATEGORY_ORDERS,
+        DASHBOARD_COLUMNS,
+        TIMEZONE_TO_COUNTRY,
+        PHONE_PREFIX_TO_COUNTRY,
+        sorted(CANADIAN_AREA_CODES),
+        COUNTRY_TO_SEGMENT,
+    ):
+        h.update(repr(table).encode())
+    return h.hexdigest()
+
+
+def dataset_key(data: bytes) -> str:
+    """Cache key for an uploaded file: content hash + tables version."""
+    return f"{hashlib.blake2b(data, digest_size=16).hexdigest()}-{tables_version()}"
+
+
+def _entry_path(key: str, cache_dir: str) -> Path:
+    return Path(cache_dir) / f"{key}.parquet"
+
+
+def read_cached(key: str, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """Return the cached enriched dataframe for key, or None on a miss."""
+    if not HAS_PYARROW:
+        return None
+
+    path = _entry_path(key, cache_dir)
+    if not path.exists():
+        return None
+
+    try:
+        df = pd.read_parquet(path)
+    except Exception:
+        # Corrupt or partially written entry - drop it and rebuild
+        path.unlink(missing_ok=True)
+        return None
+
+    # Mark as recently used for LRU eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return df
+
+
+def write_cached(key: str, df: pd.DataFrame, cache_dir: str = CACHE_DIR,
+                 max_bytes: int = CACHE_MAX_BYTES):
+    """Store an enriched dataframe under key, then evict down to max_bytes."""
+    if not HAS_PYARROW:
+        return
+
+    path = _entry_path(key, cache_dir)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file first so readers never see a partial entry.
+        # The name is unique per writer: sessions are threads of one process.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            df.to_parquet(tmp, index=True)
+        os.replace(tmp_path, path)
+
+        evict(cache_dir, max_bytes)
+    except OSError:
+        # Best effort, like read_cached: a full or read-only disk means no caching
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def evict(cache_dir: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for path in Path(cache_dir).glob("*.parquet"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            continue
+        total -= size
@@ -0,0 +1,109 @@
+"""
+Process-wide store of loaded datasets shared across Streamlit sessions.
+
+Sessions that upload the same export (same dataset_key) share one loaded,
+read-only dataset instead of each parsing and holding its own copy. Every
+session holds a lease; when the lease is dropped (the session ends or moves
+to another upload) the reference is released. Unreferenced datasets stay
+available for later uploads until the store exceeds its memory budget.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+from config import DATASET_STORE_MAX_BYTES
+from session_cache import estimate_size
+
+
+class DatasetLease:
+    """Handle keeping one dataset referenced; release happens when it is collected."""
+
+    def __init__(self, key: str):
+        self.key = key
+
+
+class _Entry:
+    def __init__(self, value, nbytes: int):
+        self.value = value
+        self.nbytes = nbytes
+        self.refs = 0
+
+
+class DatasetStore:
+    """
+    Reference-counted datasets keyed by content hash.
+
+    Values must be treated as immutable: every session holding a lease sees
+    the same object.
+    """
+
+    def __init__(self, max_bytes: int = DATASET_STORE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        # Reentrant: a lease finalizer can run from garbage collection while
+        # this thread already holds the lock
+        self._lock = threading.RLock()
+
+    def acquire(self, key: str, load) -> tuple:
+        """
+        The dataset for key, calling load() only if no session has it.
+
+        Returns (value, lease). Keep the lease for as long as the value is
+        used; concurrent first uploads of the same key wait for one load.
+        """
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refs += 1
+                    self._entries.move_to_end(key)
+
+            if entry is None:
+                value = load()
+                entry = _Entry(value, estimate_size(value))
+                with self._lock:
+                    entry.refs += 1
+                    self._entries[key] = entry
+                    self.nbytes += entry.nbytes
+                    self._evict()
+
+        lease = DatasetLease(key)
+        weakref.finalize(lease, self._release, key)
+        return entry.value, lease
+
+    def _release(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs -= 1
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used unreferenced datasets while over budget."""
+        for key in list(self._entries):
+            if self.nbytes <= self.max_bytes:
+                break
+            entry = self._entries.get(key)
+            if entry is not None and entry.refs == 0:
+                del self._entries[key]
+                self._loading.pop(key, None)
+                self.nbytes -= entry.nbytes
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "datasets": len(self._entries),
+                "referenced": sum(1 for entry in self._entries.values() if entry.refs),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# One store per server process, shared by every session
+store = DatasetStore()
@@ -0,0 +1,172 @@
+"""
+Optional DuckDB analytics backend.
+
+Loads an enriched dataset (deals or cube) into an in-process, in-memory
+DuckDB database and runs the dashboard's filtering and metric groupings as
+SQL. Results come back as the same pandas frames data_processing returns,
+so the chart and table functions work unchanged. No server is involved.
+"""
+
+import pandas as pd
+
+from data_processing import BASE_MEASURES, calculate_metrics, calculate_summary_metrics
+
+try:
+    import duckdb
+    HAS_DUCKDB = True
+except ImportError:
+    HAS_DUCKDB = False
+
+
+class DuckDBBackend:
+    """
+    One enriched dataset held in DuckDB.
+
+    Mirrors the FilterIndex interface for the sidebar (options, date_bounds)
+    and takes the same filter keyword arguments as FilterIndex.filter.
+    """
+
+    def __init__(self, con, table: str = "deals", nbytes: int = 0):
+        self.con = con
+        self.table = table
+        # Approximate memory held, for size-bounded caches
+        self.nbytes = nbytes
+        self.columns = [row[0] for row in con.execute(f"DESCRIBE {table}").fetchall()]
+        self.is_cube = "Deals" in self.columns
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "DuckDBBackend":
+        """Copy an enriched dataframe (or cube) into a new in-memory database."""
+        con = duckdb.connect()
+        con.register("source_frame", df)
+        con.execute("CREATE TABLE deals AS SELECT * FROM source_frame")
+        con.unregister("source_frame")
+        return cls(con, nbytes=int(df.memory_usage(deep=True).sum()))
+
+    def _query(self, sql: str, params: list = None) -> pd.DataFrame:
+        # A cursor per query so Streamlit reruns on other threads are safe
+        return self.con.cursor().execute(sql, params or []).df()
+
+    def options(self, col: str) -> list:
+        """Sorted distinct non-null values of a filter column."""
+        if col not in self.columns:
+            return []
+        values = self._query(
+            f'SELECT DISTINCT "{col}" AS v FROM {self.table} WHERE "{col}" IS NOT NULL'
+        )
+        return sorted(values["v"].tolist())
+
+    def date_bounds(self) -> tuple:
+        """(min, max) created date, or None if no row has one."""
+        if "created_date" not in self.columns:
+            return None
+        bounds = self._query(
+            f"SELECT MIN(created_date) AS lo, MAX(created_date) AS hi FROM {self.table}"
+        )
+        if bounds["lo"].isna().iloc[0]:
+            return None
+        return bounds["lo"].iloc[0].date(), bounds["hi"].iloc[0].date()
+
+    def _where(
+        self,
+        date_range: tuple = None,
+        sc_types: list = None,
+        pipelines: list = None,
+        segments: list = None,
+        aes: list = None,
+    ) -> tuple:
+        """WHERE clause and parameters for the FilterIndex.filter arguments."""
+        clauses, params = [], []
+
+        if date_range and len(date_range) == 2 and "created_date" in self.columns:
+            clauses.append("created_date >= ? AND created_date < ?")
+            params += [
+                pd.Timestamp(date_range[0]).to_pydatetime(),
+                (pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)).to_pydatetime(),
+            ]
+
+        for col, values in (("sc_type", sc_types), ("pipeline", pipelines), ("segment", segments)):
+            if values and col in self.columns:
+                placeholders = ", ".join("?" * len(values))
+                clauses.append(f'CAST("{col}" AS VARCHAR) IN ({placeholders})')
+                params += list(values)
+
+        # AE filter only applies to demo-held deals
+        if aes and "ae_name" in self.columns:
+            placeholders = ", ".join("?" * len(aes))
+            clauses.append(f"(CAST(ae_name AS VARCHAR) IN ({placeholders}) OR NOT is_demo_held)")
+            params += list(aes)
+
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _measures_sql(self) -> str:
+        """SELECT list computing BASE_MEASURES from deals or cube cells."""
+        if self.is_cube:
+            return ", ".join(f'SUM("{measure}") AS "{measure}"' for measure in BASE_MEASURES)
+        return (
+            'COUNT(*) AS "Deals", '
+            'COUNT(title) AS "Demos_Booked", '
+            'SUM(CAST(is_demo_held AS INTEGER)) AS "Demos_Held", '
+            'SUM(CAST(is_won AS INTEGER)) AS "Won", '
+            'SUM(won_value) AS "Won_Value"'
+        )
+
+    def _aggregate(self, sql: str, params: list) -> pd.DataFrame:
+        """Run an aggregate query, giving measures the dtypes pandas would."""
+        result = self._query(sql, params)
+        # SUMs come back nullable (NULL over no rows)
+        for measure in BASE_MEASURES:
+            dtype = "float64" if measure == "Won_Value" else "int64"
+            result[measure] = result[measure].fillna(0).astype(dtype)
+        return result
+
+    def aggregate_measures(self, group_cols: list, **filters) -> pd.DataFrame:
+        """data_processing.aggregate_measures over the filtered rows."""
+        where, params = self._where(**filters)
+        cols = ", ".join(f'"{col}"' for col in group_cols)
+        return self._aggregate(
+            f"SELECT {cols}, {self._measures_sql()} FROM {self.table}{where} "
+            f"GROUP BY {cols} ORDER BY {cols}",
+            params,
+        )
+
+    def calculate_metrics(self, group_cols: list, **filters) -> pd.DataFrame:
+        """data_processing.calculate_metrics over the filtered rows."""
+        return calculate_metrics(self.aggregate_measures(group_cols, **filters), group_cols)
+
+    def calculate_grouping_sets(self, grouping_sets: list, **filters) -> dict:
+        """
+        data_processing.calculate_grouping_sets as one GROUPING SETS query.
+
+        Returns {tuple(group_cols): metrics}; () maps to the summary dict.
+        """
+        grouping_sets = [tuple(cols) for cols in grouping_sets]
+        grain = list(dict.fromkeys(col for cols in grouping_sets for col in cols))
+        where, params = self._where(**filters)
+        sets_sql = ", ".join(
+            "(" + ", ".join(f'"{col}"' for col in cols) + ")" for cols in grouping_sets
+        )
+        grain_sql = ", ".join(f'"{col}"' for col in grain)
+        if grain:
+            select_grain = f"{grain_sql}, GROUPING({grain_sql}) AS _grouping, "
+        else:
+            select_grain = "0 AS _grouping, "
+
+        result = self._aggregate(
+            f"SELECT {select_grain}{self._measures_sql()} FROM {self.table}{where} "
+            f"GROUP BY GROUPING SETS ({sets_sql})",
+            params,
+        )
+
+        results = {}
+        for cols in grouping_sets:
+            # GROUPING() sets bit (len(grain) - 1 - i) when grain[i] is rolled up
+            grouping_id = sum(
+                1 << (len(grain) - 1 - i) for i, col in enumerate(grain) if col not in cols
+            )
+            rows = result[result["_grouping"] == grouping_id]
+            if cols:
+                results[cols] = calculate_metrics(rows[list(cols) + BASE_MEASURES], list(cols))
+            else:
+                results[cols] = calculate_summary_metrics(rows[BASE_MEASURES])
+        return results
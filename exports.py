@@ -0,0 +1,54 @@
+"""
+On-demand downloads of the dashboard's data tables.
+
+Nothing is serialized on a rerun: export_payload returns a callable that
+st.download_button runs only when the button is clicked. Payloads are
+cached by table fingerprint and format.
+"""
+
+import gzip
+import io
+
+import pandas as pd
+
+from config import EXPORT_CACHE_MAX_BYTES
+from data_processing import HAS_PYARROW
+from session_cache import MemoCache
+from visualizations.figure_cache import fingerprint
+
+# Format label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+# Shared by every session; payloads only depend on table content
+_payloads = MemoCache(EXPORT_CACHE_MAX_BYTES)
+
+
+def export_formats() -> list:
+    """Formats available here (Parquet needs pyarrow)."""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "Parquet" or HAS_PYARROW]
+
+
+def serialize_table(df: pd.DataFrame, fmt: str) -> bytes:
+    """df encoded in one of EXPORT_FORMATS."""
+    if fmt == "CSV":
+        return df.to_csv(index=False).encode("utf-8")
+    if fmt == "CSV (gzip)":
+        return gzip.compress(df.to_csv(index=False).encode("utf-8"), mtime=0)
+    if fmt == "Parquet":
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def export_payload(df: pd.DataFrame, fmt: str):
+    """Zero-argument callable building (or fetching) df's payload in fmt."""
+    def build() -> bytes:
+        return _payloads.get_or_compute(
+            (fingerprint(df), fmt), lambda: serialize_table(df, fmt)
+        )
+    return build
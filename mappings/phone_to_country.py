@@ -2,9 +2,12 @@
 Phone prefix to country mapping and parsing functions.
 """
 
+import numpy as np
+import pandas as pd
+
 PHONE_PREFIX_TO_COUNTRY = {
-    # North America (+1 handled separately with area codes)
-    "+1": "USA",  # Default, use area code for Canada detection
+    # North America (Canadian area codes are folded in as +1XXX prefixes)
+    "+1": "USA",  # Default when the area code isn't Canadian or Caribbean
 
     # Europe
     "+44": "UK",
@@ -126,6 +129,21 @@ CANADIAN_AREA_CODES = {
 }
 
 
+def _build_prefix_index() -> dict:
+    """Fold Canadian area codes into the prefix table as +1XXX entries."""
+    index = dict(PHONE_PREFIX_TO_COUNTRY)
+    for area_code in CANADIAN_AREA_CODES:
+        index[f"+1{area_code}"] = "Canada"
+    return index
+
+
+# Prefix -> country, including +1 area-code overrides (Canada, Caribbean)
+PREFIX_INDEX = _build_prefix_index()
+
+# Distinct prefix lengths, longest first, so the longest match wins
+_PREFIX_LENGTHS = sorted({len(prefix) for prefix in PREFIX_INDEX}, reverse=True)
+
+
 def parse_country_from_phone(phone: str) -> str:
     """Extract country from phone number prefix."""
     if not phone:
@@ -134,21 +152,36 @@ def parse_country_from_phone(phone: str) -> str:
     # Clean phone number
     phone = str(phone).strip().replace("'", "").replace(" ", "").replace("-", "")
 
-    # Handle +1 (USA/Canada)
-    if phone.startswith("+1") or (phone.startswith("1") and len(phone) >= 11):
-        # Extract area code (digits 2-4 for +1, or 1-3 for 1)
-        if phone.startswith("+1"):
-            area_code = phone[2:5]
-        else:
-            area_code = phone[1:4]
-
-        if area_code in CANADIAN_AREA_CODES:
-            return "Canada"
-        return "USA"
+    # North American numbers written without the + (1 + 10 digits)
+    if phone.startswith("1") and len(phone) >= 11:
+        phone = "+" + phone
 
-    # Check other prefixes (longest match first)
-    for prefix in sorted(PHONE_PREFIX_TO_COUNTRY.keys(), key=len, reverse=True):
-        if phone.startswith(prefix):
-            return PHONE_PREFIX_TO_COUNTRY[prefix]
+    for length in _PREFIX_LENGTHS:
+        country = PREFIX_INDEX.get(phone[:length])
+        if country:
+            return country
 
     return None
+
+
+def parse_countries_from_phones(phones) -> np.ndarray:
+    """
+    Batch version of parse_country_from_phone for already-normalized phones.
+
+    Returns an object array with a country (or None) per phone.
+    """
+    phones = pd.Series(phones, dtype=object).astype(str)
+
+    national = phones.str.startswith("1") & (phones.str.len() >= 11)
+    phones = phones.where(~national, "+" + phones)
+
+    countries = pd.Series(None, index=phones.index, dtype=object)
+    for length in _PREFIX_LENGTHS:
+        missing = countries.isna()
+        if not missing.any():
+            break
+        countries[missing] = phones[missing].str[:length].map(PREFIX_INDEX)
+
+    result = countries.to_numpy(dtype=object, copy=True)
+    result[pd.isna(result)] = None
+    return result
@@ -0,0 +1,86 @@
+"""
+Background precomputation of dashboard views.
+
+After an upload the app submits every view's figures and tables for the
+default filters to a thread pool, so they are usually in the session memo
+by the time a view is opened. Work queued for a filter state the user has
+moved away from is cancelled.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from config import PRECOMPUTE_WORKERS
+
+# One pool per process: app.py reruns, imported modules do not
+_executor = ThreadPoolExecutor(max_workers=PRECOMPUTE_WORKERS, thread_name_prefix="precompute")
+
+
+class Precomputer:
+    """
+    Background jobs feeding one session's MemoCache.
+
+    Jobs store their results under the same keys the render path memoizes,
+    so the render path either hits the memo or waits on the running job
+    instead of computing the same value twice.
+    """
+
+    def __init__(self, memo):
+        self.memo = memo
+        self.state_key = None
+        self.futures = {}
+
+    def submit(self, state_key: tuple, artifacts: dict):
+        """
+        Compute artifacts ({name: compute}) for state_key in the background.
+
+        Supersedes (and cancels) jobs for any other state; a repeat call for
+        the current state is a no-op.
+        """
+        if state_key == self.state_key:
+            return
+        self.cancel()
+        self.state_key = state_key
+        for name, compute in artifacts.items():
+            key = state_key + (name,)
+            if key not in self.memo:
+                self.futures[key] = _executor.submit(self._run, key, compute)
+
+    def _run(self, key: tuple, compute):
+        # cancel() can't stop a job that already started; skip if superseded
+        # by the time it gets a worker. A result stored later is still valid
+        # for its own key.
+        if key[:-1] != self.state_key:
+            return None
+        value = compute()
+        self.memo.put(key, value)
+        return value
+
+    def cancel(self):
+        """Cancel queued jobs; running ones finish without being waited on."""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        self.state_key = None
+
+    def get_or_compute(self, key: tuple, compute):
+        """
+        MemoCache.get_or_compute that waits on a running job for key.
+
+        A job still queued behind other work is cancelled and computed here
+        instead, so the render path never waits for a worker to free up.
+        """
+        missing = object()
+        value = self.memo.get(key, missing)
+        if value is not missing:
+            return value
+
+        future = self.futures.get(key)
+        # cancel() fails only once the job is running (or done)
+        if future is not None and not future.cancel():
+            value = future.result()
+            if value is not None:
+                return value
+
+        value = compute()
+        self.memo.put(key, value)
+        return value
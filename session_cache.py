@@ -0,0 +1,152 @@
+"""
+Session-scoped memo cache for filtered frames, metric tables and figures.
+
+Streamlit reruns app.py on every widget change. Results are memoized under
+(dataset key, kind, normalized filter state, ...) tuples, so returning to an
+earlier filter state is a lookup. Entries are evicted least recently used
+first once their estimated size exceeds the memory budget.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from config import MEMO_MAX_BYTES
+
+
+# Allowance for a figure's layout and trace styling; its data arrays are
+# counted separately
+FIGURE_OVERHEAD_BYTES = 16 * 1024
+
+
+def _trace_bytes(props: dict) -> int:
+    """Bytes held by the arrays and lists in a trace's stored properties."""
+    total = 0
+    for value in props.values():
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+        elif isinstance(value, dict):
+            total += _trace_bytes(value)
+        elif isinstance(value, (list, tuple)):
+            total += sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+    return total
+
+
+def estimate_size(value) -> int:
+    """Rough in-memory size of a cached value, in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, go.Figure):
+        # Read the stored trace dicts in place; to_plotly_json would deep-copy
+        # the whole figure on every put
+        return FIGURE_OVERHEAD_BYTES + sum(_trace_bytes(trace) for trace in value._data)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def filter_state(filters: dict) -> tuple:
+    """
+    Hashable, order-independent form of the FilterIndex.filter arguments.
+
+    Multiselect values become sorted tuples and dates ISO strings, so the
+    same selection made in a different order maps to the same key.
+    """
+    state = []
+    for name, value in sorted(filters.items()):
+        if value is None:
+            normalized = None
+        elif name == "date_range":
+            normalized = tuple(pd.Timestamp(d).date().isoformat() for d in value)
+        else:
+            normalized = tuple(sorted(str(v) for v in value))
+        state.append((name, normalized))
+    return tuple(state)
+
+
+class MemoCache:
+    """
+    LRU memo cache bounded by estimated memory use.
+
+    Thread-safe, so background work can fill it while the script reruns.
+    """
+
+    def __init__(self, max_bytes: int = MEMO_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key, default=None):
+        """Cached value for key (marking it recently used), or default."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store value, evicting least recently used entries over budget."""
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            # A value larger than the whole budget is not worth caching
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Cached value for key, computing and storing it on a miss."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Counters for the debug panel."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
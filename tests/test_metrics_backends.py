@@ -0,0 +1,139 @@
+"""
+The numpy and pandas metrics backends must give the same results.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import data_processing
+from config import AES, DASHBOARD_GROUPINGS
+from data_processing import (
+    _bincount_measures,
+    aggregate_measures,
+    build_cube,
+    calculate_grouping_sets,
+    calculate_metrics,
+    enrich_dataframe,
+)
+
+# () is the KPI summary (calculate_summary_metrics), not a calculate_metrics call
+GROUPINGS = [list(cols) for cols in DASHBOARD_GROUPINGS if cols]
+
+
+def _raw_deals(n: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """Deals as load_and_clean_csv returns them, with nulls in every input."""
+    rng = np.random.default_rng(seed)
+    titles = rng.choice(["Deal SC1", "Deal sc3", "Deal SC5", "Deal SC6", "Deal SC12", "Plain deal", None], n)
+    owners = rng.choice(list(AES) + ["Some SDR", "Other Rep", None], n)
+    timezones = rng.choice(
+        ["America/New_York", "Europe/London", "Asia/Tokyo", "Asia/Dubai", "Mars/Base", None], n
+    )
+    phones = rng.choice(["+49 30 123456", "+1 876 555 0100", "'+44 20 7946 0958", "12345", None], n)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 90 * 24, n), unit="h")
+    return pd.DataFrame({
+        "title": titles,
+        "deal_value": rng.integers(0, 5000, n).astype(float),
+        "pipeline": rng.choice(["Sales", "Partners"], n),
+        "status": rng.choice(["Open", "Won", "Lost"], n),
+        "owner": owners,
+        "phone": phones,
+        "created_date": pd.Series(dates).where(rng.random(n) > 0.05),
+        "timezone": timezones,
+    })
+
+
+@pytest.fixture(scope="module")
+def deals() -> pd.DataFrame:
+    return enrich_dataframe(_raw_deals())
+
+
+@pytest.fixture(scope="module")
+def categorical_deals() -> pd.DataFrame:
+    return enrich_dataframe(_raw_deals(), categorical=True, drop_raw=True)
+
+
+def assert_backends_agree(df: pd.DataFrame, group_cols: list):
+    expected = calculate_metrics(df, group_cols, backend="pandas")
+    result = calculate_metrics(df, group_cols, backend="numpy")
+    assert_frame_equal(result, expected, check_dtype=False, check_categorical=False)
+
+
+def assert_grouping_sets_agree(df: pd.DataFrame):
+    expected = calculate_grouping_sets(df, DASHBOARD_GROUPINGS, backend="pandas")
+    result = calculate_grouping_sets(df, DASHBOARD_GROUPINGS, backend="numpy")
+    assert result.keys() == expected.keys()
+    for cols in GROUPINGS:
+        assert_frame_equal(
+            result[tuple(cols)], expected[tuple(cols)], check_dtype=False, check_categorical=False
+        )
+    assert result[()] == pytest.approx(expected[()])
+
+
+@pytest.mark.parametrize("group_cols", GROUPINGS)
+def test_object_frame(deals, group_cols):
+    assert_backends_agree(deals, group_cols)
+
+
+@pytest.mark.parametrize("group_cols", GROUPINGS)
+def test_categorical_frame(categorical_deals, group_cols):
+    assert_backends_agree(categorical_deals, group_cols)
+
+
+@pytest.mark.parametrize("group_cols", GROUPINGS)
+def test_held_only_subset(deals, categorical_deals, group_cols):
+    assert_backends_agree(deals[deals["is_demo_held"]], group_cols)
+    assert_backends_agree(categorical_deals[categorical_deals["is_demo_held"]], group_cols)
+
+
+@pytest.mark.parametrize("group_cols", GROUPINGS)
+def test_cube(categorical_deals, group_cols):
+    assert_backends_agree(build_cube(categorical_deals), group_cols)
+
+
+def test_null_group_keys(deals):
+    # ae_name is null for every non-AE deal; those rows drop out of the groups
+    assert deals["ae_name"].isna().any()
+    assert_backends_agree(deals, ["ae_name"])
+
+    with_null_country = deals.assign(
+        country=deals["country"].where(np.arange(len(deals)) % 7 != 0)
+    )
+    assert_backends_agree(with_null_country, ["country", "segment"])
+
+
+def test_empty_frame(deals):
+    assert_backends_agree(deals.iloc[:0], ["sc_type"])
+
+
+def test_unorderable_keys(deals):
+    # int and str keys can't be sorted together; whether factorize copes or
+    # the numpy backend falls back to groupby, the result must not change
+    mixed = deals.assign(sc_type=deals["sc_type"].astype(object))
+    mixed.loc[mixed.index[::3], "sc_type"] = 1
+    assert_backends_agree(mixed, ["sc_type"])
+    assert_backends_agree(mixed, ["ae_name", "sc_type"])
+
+
+def test_key_space_above_limit_falls_back(deals, monkeypatch):
+    monkeypatch.setattr(data_processing, "BINCOUNT_MAX_GROUPS", 1)
+    assert _bincount_measures(deals, ["ae_name", "sc_type"]) is None
+    assert_backends_agree(deals, ["ae_name", "sc_type"])
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_aggregate_measures_keeps_null_keys(deals, categorical_deals, categorical):
+    df = categorical_deals if categorical else deals
+    grain = ["country", "segment", "ae_name", "sc_type"]
+    expected = aggregate_measures(df, grain, backend="pandas")
+    result = aggregate_measures(df, grain, backend="numpy")
+    assert result["ae_name"].isna().any()
+    assert_frame_equal(result, expected, check_dtype=False, check_categorical=False)
+
+
+def test_grouping_sets(deals, categorical_deals):
+    assert_grouping_sets_agree(deals)
+    assert_grouping_sets_agree(categorical_deals)
+    assert_grouping_sets_agree(categorical_deals[categorical_deals["is_demo_held"]])
+    assert_grouping_sets_agree(build_cube(categorical_deals))
@@ -12,6 +12,8 @@ from .charts import (
     create_country_sc_bar,
 )
 
+from .figure_cache import cache_stats as figure_cache_stats
+
 from .tables import (
     format_metrics_table,
     get_column_config,
@@ -27,6 +29,7 @@ __all__ = [
     "create_ae_segment_heatmap",
     "create_ae_sc_heatmap",
     "create_country_sc_bar",
+    "figure_cache_stats",
     "format_metrics_table",
     "get_column_config",
     "display_styled_table",
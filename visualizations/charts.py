@@ -6,82 +6,146 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 
-from config import COLORS, HEATMAP_COLORSCALE
+from config import (
+    COLORS,
+    HEATMAP_COLORSCALE,
+    CHART_RENDER_MODE,
+    WEBGL_MIN_POINTS,
+    CHART_MAX_GROUPS,
+    SCATTER_MAX_POINTS,
+)
+from .figure_cache import memoize_figure
 
 
+OTHER_LABEL = "Other"
+
+# Additive metric columns, summed when groups are merged into OTHER_LABEL
+_COUNT_COLUMNS = ["Deals", "Demos_Booked", "Demos_Held", "Won", "Won_Value", "No_Shows"]
+
+
+def _bucket_tail(df: pd.DataFrame, name_col: str, max_groups: int,
+                 group_cols: tuple = ()) -> pd.DataFrame:
+    """
+    Merge all but the max_groups largest name_col values into OTHER_LABEL.
+
+    Groups are ranked by total Demos_Held. Tail rows are summed per
+    group_cols and Won_Pct is recomputed; other ratio columns are dropped.
+    Returns df unchanged when it has max_groups names or fewer.
+    """
+    totals = df.groupby(name_col, observed=True)["Demos_Held"].sum()
+    if len(totals) <= max_groups:
+        return df
+
+    keep = df[name_col].isin(totals.nlargest(max_groups).index)
+    counts = [c for c in _COUNT_COLUMNS if c in df.columns]
+    tail = df[~keep]
+    if group_cols:
+        other = tail.groupby(list(group_cols), observed=True)[counts].sum().reset_index()
+    else:
+        other = tail[counts].sum().to_frame().T
+    other[name_col] = OTHER_LABEL
+    held = other["Demos_Held"]
+    other["Won_Pct"] = (other["Won"] / held.where(held != 0)).fillna(0)
+
+    columns = [name_col, *group_cols, *counts, "Won_Pct"]
+    head = df.loc[keep, columns].astype({name_col: str})
+    return pd.concat([head, other[columns]], ignore_index=True)
+
+
+# Static parts of the country map; only locations, z and customdata depend on data
+_MAP_TRACE_STYLE = dict(
+    locationmode="country names",
+    # customdata columns: Won_Pct, Demos_Held, Won, Won_Value
+    hovertemplate=(
+        "<b>%{location}</b><br>"
+        "Won Rate: %{customdata[0]:.1%}<br>"
+        "Demos Held: %{customdata[1]:,.0f}<br>"
+        "Won: %{customdata[2]:,.0f}<br>"
+        "Value: $%{customdata[3]:,.0f}<extra></extra>"
+    ),
+    colorscale=[
+        [0.0, "#dc3545"],      # Red - 0%
+        [0.4, "#ffc107"],      # Yellow - 8%
+        [0.6, "#28a745"],      # Green - 12%
+        [1.0, "#155724"],      # Dark green - 20%+
+    ],
+    zmin=0,
+    zmax=0.20,
+    marker=dict(
+        line=dict(color="#ffffff", width=0.5)
+    ),
+    colorbar=dict(
+        title=dict(text="Won %", font=dict(size=14)),
+        tickformat=".0%",
+        tickvals=[0, 0.05, 0.10, 0.15, 0.20],
+        ticktext=["0%", "5%", "10%", "15%", "20%"],
+        len=0.6,
+        thickness=15,
+        x=1.02,
+    ),
+)
+
+_MAP_LAYOUT = dict(
+    geo=dict(
+        showframe=False,
+        showcoastlines=True,
+        coastlinecolor="#cccccc",
+        showland=True,
+        landcolor="#f8f9fa",
+        showocean=True,
+        oceancolor="#e3f2fd",
+        showlakes=True,
+        lakecolor="#e3f2fd",
+        showcountries=True,
+        countrycolor="#dee2e6",
+        countrywidth=0.5,
+        projection_type="natural earth",
+        bgcolor="rgba(0,0,0,0)",
+    ),
+    height=550,
+    margin=dict(l=0, r=0, t=10, b=0),
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+)
+
+_map_spec = None
+
+
+def _country_map_spec() -> dict:
+    """Validated figure dict for the map with empty data, built once."""
+    global _map_spec
+    if _map_spec is None:
+        fig = go.Figure(data=go.Choropleth(**_MAP_TRACE_STYLE), layout=_MAP_LAYOUT)
+        _map_spec = fig.to_dict()
+    return _map_spec
+
+
+@memoize_figure
 def create_country_map(df: pd.DataFrame) -> go.Figure:
     """
     Create choropleth map showing Won % by country.
 
     df should have columns: country, Won_Pct, Demos_Held, Won, Won_Value
+
+    Only locations, z and customdata are patched into the prebuilt map
+    spec; the hover text is formatted by Plotly from customdata.
     """
-    # Create custom hover text
-    df = df.copy()
-    df["hover_text"] = df.apply(
-        lambda row: (
-            f"<b>{row['country']}</b><br>"
-            f"Won Rate: {row['Won_Pct']:.1%}<br>"
-            f"Demos Held: {int(row['Demos_Held']):,}<br>"
-            f"Won: {int(row['Won']):,}<br>"
-            f"Value: ${row['Won_Value']:,.0f}"
-        ),
-        axis=1
+    spec = _country_map_spec()
+    trace = dict(
+        spec["data"][0],
+        locations=df["country"].astype(str).tolist(),
+        z=df["Won_Pct"].to_numpy(dtype=float),
+        customdata=df[["Won_Pct", "Demos_Held", "Won", "Won_Value"]].to_numpy(dtype=float),
     )
 
-    fig = go.Figure(data=go.Choropleth(
-        locations=df["country"],
-        locationmode="country names",
-        z=df["Won_Pct"],
-        text=df["hover_text"],
-        hoverinfo="text",
-        colorscale=[
-            [0.0, "#dc3545"],      # Red - 0%
-            [0.4, "#ffc107"],      # Yellow - 8%
-            [0.6, "#28a745"],      # Green - 12%
-            [1.0, "#155724"],      # Dark green - 20%+
-        ],
-        zmin=0,
-        zmax=0.20,
-        marker=dict(
-            line=dict(color="#ffffff", width=0.5)
-        ),
-        colorbar=dict(
-            title=dict(text="Won %", font=dict(size=14)),
-            tickformat=".0%",
-            tickvals=[0, 0.05, 0.10, 0.15, 0.20],
-            ticktext=["0%", "5%", "10%", "15%", "20%"],
-            len=0.6,
-            thickness=15,
-            x=1.02,
-        ),
-    ))
-
-    fig.update_layout(
-        geo=dict(
-            showframe=False,
-            showcoastlines=True,
-            coastlinecolor="#cccccc",
-            showland=True,
-            landcolor="#f8f9fa",
-            showocean=True,
-            oceancolor="#e3f2fd",
-            showlakes=True,
-            lakecolor="#e3f2fd",
-            showcountries=True,
-            countrycolor="#dee2e6",
-            countrywidth=0.5,
-            projection_type="natural earth",
-            bgcolor="rgba(0,0,0,0)",
-        ),
-        height=550,
-        margin=dict(l=0, r=0, t=10, b=0),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-    )
+    # The spec was validated when built, so skip re-validating the geo
+    # layout (go.Figure still copies it, leaving the spec untouched)
+    fig = go.Figure({"data": [trace], "layout": spec["layout"]}, _validate=False)
 
     return fig
 
 
+@memoize_figure
 def create_ae_bar_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create horizontal bar chart ranking AEs by Won %.
@@ -91,62 +155,123 @@ def create_ae_bar_chart(df: pd.DataFrame) -> go.Figure:
     # Determine column name
     name_col = "ae_name" if "ae_name" in df.columns else "owner"
 
-    df_sorted = df.sort_values("Won_Pct", ascending=True)
-
-    fig = px.bar(
-        df_sorted,
-        x="Won_Pct",
-        y=name_col,
-        orientation="h",
-        text=df_sorted["Won_Pct"].apply(lambda x: f"{x:.1%}"),
-        hover_data={"Demos_Held": True, "Won": True},
-        color="Won_Pct",
-        color_continuous_scale="RdYlGn",
-        range_color=[0, 0.20],
-        title="Won % by AE"
-    )
+    # Bound the number of bars however many owners there are
+    df = _bucket_tail(df, name_col, CHART_MAX_GROUPS)
 
-    fig.update_traces(textposition="outside")
-    fig.update_layout(
-        xaxis_title="Won %",
-        yaxis_title="",
-        xaxis_tickformat=".0%",
-        showlegend=False,
-        height=400,
-        coloraxis_showscale=False
+    df_sorted = df.sort_values("Won_Pct", ascending=True)
+    won_pct = df_sorted["Won_Pct"].to_numpy()
+
+    # One trace from column arrays; labels are formatted by Plotly
+    fig = go.Figure(
+        data=go.Bar(
+            x=won_pct,
+            y=df_sorted[name_col].astype(str).to_numpy(),
+            orientation="h",
+            texttemplate="%{x:.1%}",
+            textposition="outside",
+            customdata=df_sorted[["Demos_Held", "Won"]].to_numpy(),
+            hovertemplate=(
+                f"Won_Pct=%{{x}}<br>{name_col}=%{{y}}<br>"
+                "Demos_Held=%{customdata[0]}<br>Won=%{customdata[1]}<extra></extra>"
+            ),
+            marker=dict(
+                color=won_pct,
+                colorscale="RdYlGn",
+                cmin=0,
+                cmax=0.20,
+                showscale=False,
+            ),
+        ),
+        layout=dict(
+            title="Won % by AE",
+            xaxis_title="Won %",
+            yaxis_title="",
+            xaxis_tickformat=".0%",
+            showlegend=False,
+            height=400,
+        ),
     )
 
     return fig
 
 
-def create_ae_scatter(df: pd.DataFrame) -> go.Figure:
+def _ae_scatter_gl(df: pd.DataFrame, name_col: str) -> go.Figure:
     """
-    Create scatter plot: X = Demos Held (volume), Y = Won % (quality).
+    WebGL version of the AE scatter for many points.
 
-    Helps identify performance quadrants.
+    Names go in the hover only (no per-point text labels), and each value
+    is sent once: color reuses y and the hover reads Won_Value from the
+    marker size instead of duplicating it in customdata.
     """
-    name_col = "ae_name" if "ae_name" in df.columns else "owner"
-
-    fig = px.scatter(
-        df,
-        x="Demos_Held",
-        y="Won_Pct",
-        text=name_col,
-        size="Won_Value",
-        color="Won_Pct",
-        color_continuous_scale="RdYlGn",
-        range_color=[0, 0.20],
-        hover_data={
-            "Won": True,
-            "Won_Value": ":$,.0f"
-        },
-        title="AE Performance: Volume vs Quality"
+    won_pct = df["Won_Pct"].to_numpy()
+    won_value = df["Won_Value"].to_numpy(dtype=float)
+    max_value = won_value.max() if len(won_value) else 0
+
+    return go.Figure(
+        data=go.Scattergl(
+            x=df["Demos_Held"].to_numpy(),
+            y=won_pct,
+            mode="markers",
+            hovertext=df[name_col].astype(str).to_numpy(),
+            customdata=df["Won"].to_numpy(),
+            hovertemplate=(
+                "<b>%{hovertext}</b><br>Demos Held: %{x:,}<br>Won %: %{y:.1%}<br>"
+                "Won: %{customdata:,}<br>Won Value: $%{marker.size:,.0f}<extra></extra>"
+            ),
+            marker=dict(
+                size=won_value,
+                # Same area scaling as plotly.express (size_max=20)
+                sizemode="area",
+                sizeref=2.0 * max_value / 20 ** 2 if max_value > 0 else 1,
+                sizemin=4,
+                color=won_pct,
+                colorscale="RdYlGn",
+                cmin=0,
+                cmax=0.20,
+                showscale=False,
+            ),
+        ),
+        layout=dict(title="AE Performance: Volume vs Quality"),
     )
 
-    fig.update_traces(
-        textposition="top center",
-        marker=dict(sizemin=10)
-    )
+
+@memoize_figure
+def create_ae_scatter(df: pd.DataFrame, render_mode: str = CHART_RENDER_MODE) -> go.Figure:
+    """
+    Create scatter plot: X = Demos Held (volume), Y = Won % (quality).
+
+    Helps identify performance quadrants. render_mode is "svg", "webgl" or
+    "auto" (WebGL above WEBGL_MIN_POINTS points). Owners beyond
+    SCATTER_MAX_POINTS are merged into one "Other" point.
+    """
+    name_col = "ae_name" if "ae_name" in df.columns else "owner"
+    points = _bucket_tail(df, name_col, SCATTER_MAX_POINTS)
+
+    if render_mode == "webgl" or (render_mode == "auto" and len(points) > WEBGL_MIN_POINTS):
+        fig = _ae_scatter_gl(points, name_col)
+    else:
+        fig = px.scatter(
+            points,
+            x="Demos_Held",
+            y="Won_Pct",
+            text=name_col,
+            size="Won_Value",
+            color="Won_Pct",
+            color_continuous_scale="RdYlGn",
+            range_color=[0, 0.20],
+            hover_data={
+                "Won": True,
+                "Won_Value": ":$,.0f"
+            },
+            title="AE Performance: Volume vs Quality",
+            # px would switch to WebGL itself above 1000 points
+            render_mode="svg"
+        )
+
+        fig.update_traces(
+            textposition="top center",
+            marker=dict(sizemin=10)
+        )
 
     fig.update_layout(
         xaxis_title="Demos Held (Volume)",
@@ -157,7 +282,7 @@ def create_ae_scatter(df: pd.DataFrame) -> go.Figure:
         coloraxis_showscale=False
     )
 
-    # Add quadrant lines (median-based)
+    # Add quadrant lines (median-based, over every owner)
     if len(df) > 0:
         median_held = df["Demos_Held"].median()
         median_won = df["Won_Pct"].median()
@@ -168,14 +293,13 @@ def create_ae_scatter(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@memoize_figure
 def create_sc_funnel(df: pd.DataFrame) -> go.Figure:
     """
     Create funnel chart showing Booked -> Held -> Won for each SC type.
 
     df should have columns: sc_type, Demos_Booked, Demos_Held, Won
     """
-    fig = go.Figure()
-
     sc_colors = {
         "SC1": COLORS.get("SC1", "#7B68EE"),
         "SC3": COLORS.get("SC3", "#3CB371"),
@@ -184,27 +308,32 @@ def create_sc_funnel(df: pd.DataFrame) -> go.Figure:
         "No SC": COLORS.get("No SC", "#808080")
     }
 
-    for _, row in df.iterrows():
-        sc_type = row["sc_type"]
-
-        fig.add_trace(go.Funnel(
-            name=sc_type,
-            y=["Booked", "Held", "Won"],
-            x=[row["Demos_Booked"], row["Demos_Held"], row["Won"]],
-            textinfo="value+percent initial",
-            marker=dict(color=sc_colors.get(sc_type, "#808080")),
-            connector=dict(line=dict(color="gray", width=1))
-        ))
-
-    fig.update_layout(
-        title="Lead Funnel by SC Type",
-        height=400,
-        showlegend=True
+    # One trace per SC type ("percent initial" is per trace), all built from
+    # the column arrays and validated in a single Figure call
+    stages = df[["Demos_Booked", "Demos_Held", "Won"]].to_numpy().tolist()
+    fig = go.Figure(
+        data=[
+            go.Funnel(
+                name=sc_type,
+                y=["Booked", "Held", "Won"],
+                x=counts,
+                textinfo="value+percent initial",
+                marker=dict(color=sc_colors.get(sc_type, "#808080")),
+                connector=dict(line=dict(color="gray", width=1))
+            )
+            for sc_type, counts in zip(df["sc_type"].astype(str).to_numpy(), stages)
+        ],
+        layout=dict(
+            title="Lead Funnel by SC Type",
+            height=400,
+            showlegend=True
+        ),
     )
 
     return fig
 
 
+@memoize_figure
 def create_ae_segment_heatmap(pivot_df: pd.DataFrame) -> go.Figure:
     """
     Create heatmap matrix: Rows = AEs, Columns = Segments, Values = Won %.
@@ -237,6 +366,7 @@ def create_ae_segment_heatmap(pivot_df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@memoize_figure
 def create_ae_sc_heatmap(pivot_df: pd.DataFrame) -> go.Figure:
     """
     Create heatmap matrix: Rows = AEs, Columns = SC Types, Values = Won %.
@@ -263,6 +393,7 @@ def create_ae_sc_heatmap(pivot_df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@memoize_figure
 def create_country_sc_bar(df: pd.DataFrame, top_n: int = 12) -> go.Figure:
     """
     Create grouped bar chart: Countries on Y-axis, bars grouped by SC Type.
@@ -270,40 +401,66 @@ def create_country_sc_bar(df: pd.DataFrame, top_n: int = 12) -> go.Figure:
     df should have columns: country, sc_type, Won_Pct, Demos_Held
     """
     # Filter to top N countries by total demos held
-    country_totals = df.groupby("country")["Demos_Held"].sum().nlargest(top_n)
+    country_totals = df.groupby("country", observed=True)["Demos_Held"].sum().nlargest(top_n)
     df_filtered = df[df["country"].isin(country_totals.index)]
 
     # Sort countries by total demos
     country_order = country_totals.index.tolist()
+    shown = f"Top {len(country_order)} Countries"
 
-    fig = px.bar(
-        df_filtered,
-        x="Won_Pct",
-        y="country",
-        color="sc_type",
-        orientation="h",
-        barmode="group",
-        text=df_filtered["Won_Pct"].apply(lambda x: f"{x:.1%}"),
-        hover_data={"Demos_Held": True, "Won": True},
-        color_discrete_map={
-            "SC1": COLORS.get("SC1", "#7B68EE"),
-            "SC3": COLORS.get("SC3", "#3CB371"),
-            "SC5": COLORS.get("SC5", "#DC143C"),
-            "SC6": COLORS.get("SC6", "#DC143C"),
-            "No SC": COLORS.get("No SC", "#808080")
-        },
-        category_orders={"country": country_order},
-        title=f"Won % by Country x SC Type (Top {top_n} Countries)"
-    )
+    # A wide top_n still draws at most CHART_MAX_GROUPS countries plus "Other"
+    if len(country_order) > CHART_MAX_GROUPS:
+        df_filtered = _bucket_tail(df_filtered, "country", CHART_MAX_GROUPS, ("sc_type",))
+        country_order = country_order[:CHART_MAX_GROUPS] + [OTHER_LABEL]
+        shown = f"Top {CHART_MAX_GROUPS} Countries + {OTHER_LABEL}"
 
-    fig.update_traces(textposition="outside")
-    fig.update_layout(
-        xaxis_title="Won %",
-        yaxis_title="",
-        xaxis_tickformat=".0%",
-        legend_title="SC Type",
-        height=500,
-        bargap=0.2
+    sc_colors = {
+        "SC1": COLORS.get("SC1", "#7B68EE"),
+        "SC3": COLORS.get("SC3", "#3CB371"),
+        "SC5": COLORS.get("SC5", "#DC143C"),
+        "SC6": COLORS.get("SC6", "#DC143C"),
+        "No SC": COLORS.get("No SC", "#808080")
+    }
+
+    # One trace per SC type (legend order = first appearance), sliced from
+    # the column arrays; labels are formatted by Plotly
+    sc_types = df_filtered["sc_type"].astype(str).to_numpy()
+    countries = df_filtered["country"].astype(str).to_numpy()
+    won_pct = df_filtered["Won_Pct"].to_numpy()
+    hover_data = df_filtered[["Demos_Held", "Won"]].to_numpy()
+
+    traces = []
+    for sc_type in pd.unique(sc_types):
+        rows = sc_types == sc_type
+        traces.append(go.Bar(
+            name=sc_type,
+            x=won_pct[rows],
+            y=countries[rows],
+            orientation="h",
+            texttemplate="%{x:.1%}",
+            textposition="outside",
+            customdata=hover_data[rows],
+            hovertemplate=(
+                f"sc_type={sc_type}<br>Won_Pct=%{{x}}<br>country=%{{y}}<br>"
+                "Demos_Held=%{customdata[0]}<br>Won=%{customdata[1]}<extra></extra>"
+            ),
+            marker=dict(color=sc_colors.get(sc_type, "#808080")),
+        ))
+
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f"Won % by Country x SC Type ({shown})",
+            barmode="group",
+            # Largest country at the top
+            yaxis=dict(categoryorder="array", categoryarray=country_order[::-1]),
+            xaxis_title="Won %",
+            yaxis_title="",
+            xaxis_tickformat=".0%",
+            legend_title="SC Type",
+            height=500,
+            bargap=0.2
+        ),
     )
 
     return fig
@@ -0,0 +1,92 @@
+"""
+Memo cache for the chart functions.
+
+Most reruns hand a chart exactly the metrics (or pivot) frame it got last
+time. Figures are cached under a content fingerprint of their frame
+arguments plus the remaining parameters, so those calls skip Plotly's
+figure construction and validation. Cached figures are shared between
+callers and sessions: treat them as read-only.
+"""
+
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from config import FIGURE_CACHE_MAX_ENTRIES
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def fingerprint(df) -> bytes:
+    """Cheap content hash of a DataFrame or Series, including its labels."""
+    h = hashlib.blake2b(digest_size=16)
+    columns = list(df.columns) if isinstance(df, pd.DataFrame) else [df.name]
+    h.update(repr((columns, df.shape)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.digest()
+
+
+def _key_part(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return fingerprint(value)
+    return value
+
+
+def memoize_figure(func):
+    """Cache func's figures by argument content, LRU beyond FIGURE_CACHE_MAX_ENTRIES."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _hits, _misses
+
+        # Bind so that f(df) and f(df, top_n=12) share an entry
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__,) + tuple(
+            (name, _key_part(value)) for name, value in bound.arguments.items()
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        with _lock:
+            if key in _cache:
+                _cache.move_to_end(key)
+                _hits += 1
+                return _cache[key]
+            _misses += 1
+
+        fig = func(*args, **kwargs)
+
+        with _lock:
+            _cache[key] = fig
+            while len(_cache) > FIGURE_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+        return fig
+
+    return wrapper
+
+
+def cache_stats() -> dict:
+    """Counters for the debug panel."""
+    with _lock:
+        return {
+            "entries": len(_cache),
+            "max_entries": FIGURE_CACHE_MAX_ENTRIES,
+            "hits": _hits,
+            "misses": _misses,
+        }
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()